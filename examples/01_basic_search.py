@@ -3,22 +3,11 @@
 Basic example of searching for foods using the USDA FDC API.
 """
 
-import os
-from dotenv import load_dotenv
-from usda_fdc import FdcClient
+from _common import get_client
 
 def main():
-    # Load API key from environment variable
-    load_dotenv()
-    api_key = os.getenv("FDC_API_KEY")
-    
-    if not api_key:
-        print("Error: FDC_API_KEY environment variable not set.")
-        print("Please set it or pass your API key directly to FdcClient.")
-        return
-    
     # Initialize the client
-    client = FdcClient(api_key)
+    client = get_client()
     
     # Search for foods containing "apple"
     print("Searching for 'apple'...")
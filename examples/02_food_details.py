@@ -3,21 +3,11 @@
 Example of retrieving detailed food information from the USDA FDC API.
 """
 
-import os
-from dotenv import load_dotenv
-from usda_fdc import FdcClient
+from _common import get_client
 
 def main():
-    # Load API key from environment variable
-    load_dotenv()
-    api_key = os.getenv("FDC_API_KEY")
-    
-    if not api_key:
-        print("Error: FDC_API_KEY environment variable not set.")
-        return
-    
     # Initialize the client
-    client = FdcClient(api_key)
+    client = get_client()
     
     # Get food by FDC ID (Apple, raw, with skin)
     fdc_id = 1750340
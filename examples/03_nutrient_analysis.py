@@ -3,22 +3,16 @@
 Example of analyzing nutrient content using the USDA FDC API.
 """
 
-import os
-from dotenv import load_dotenv
-from usda_fdc import FdcClient
+from _common import get_client
 from usda_fdc.analysis import analyze_food, DriType, Gender
 
+# Nutrients to report, with the ones whose DRI differs most by gender
+KEY_NUTRIENTS = ("protein", "fiber", "vitamin_c", "calcium", "iron")
+GENDER_SENSITIVE_NUTRIENTS = ("iron", "calcium")
+
 def main():
-    # Load API key from environment variable
-    load_dotenv()
-    api_key = os.getenv("FDC_API_KEY")
-    
-    if not api_key:
-        print("Error: FDC_API_KEY environment variable not set.")
-        return
-    
     # Initialize the client
-    client = FdcClient(api_key)
+    client = get_client()
     
     # Get food by FDC ID (Apple, raw, with skin)
     fdc_id = 1750340
@@ -44,7 +38,7 @@ def main():
     
     # Print key nutrients with DRI percentages
     print("\nKey Nutrients:")
-    for nutrient_id in ["protein", "fiber", "vitamin_c", "calcium", "iron"]:
+    for nutrient_id in KEY_NUTRIENTS:
         nutrient_value = analysis.get_nutrient(nutrient_id)
         if nutrient_value:
             dri_percent = f"{nutrient_value.dri_percent:.1f}%" if nutrient_value.dri_percent is not None else "N/A"
@@ -60,7 +54,7 @@ def main():
     )
     
     print("\nKey Nutrients (Female DRI):")
-    for nutrient_id in ["iron", "calcium"]:
+    for nutrient_id in GENDER_SENSITIVE_NUTRIENTS:
         nutrient_value = female_analysis.get_nutrient(nutrient_id)
         if nutrient_value:
             dri_percent = f"{nutrient_value.dri_percent:.1f}%" if nutrient_value.dri_percent is not None else "N/A"
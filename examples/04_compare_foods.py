@@ -3,30 +3,57 @@
 Example of comparing multiple foods using the USDA FDC API.
 """
 
-import os
-from dotenv import load_dotenv
-from usda_fdc import FdcClient
+from _common import get_client
 from usda_fdc.analysis import compare_foods
 
-def main():
-    # Load API key from environment variable
-    load_dotenv()
-    api_key = os.getenv("FDC_API_KEY")
+def format_comparison(comparison):
+    """Lay out a compare_foods() result as one table, a row per food."""
+    nutrient_ids = [nutrient_id for nutrient_id, values in comparison.items() if values]
+    if not nutrient_ids:
+        return "No nutrient data to compare."
+    
+    # Index every amount by (food, nutrient) so foods missing a nutrient get a blank cell
+    cells = {
+        (food, nutrient_id): f"{amount:.1f}"
+        for nutrient_id in nutrient_ids
+        for food, amount, _ in comparison[nutrient_id]
+    }
+    foods = list(dict.fromkeys(food for food, _ in cells))
     
-    if not api_key:
-        print("Error: FDC_API_KEY environment variable not set.")
-        return
+    # Header carries the unit from the first value of each nutrient
+    headers = [
+        f"{nutrient_id.capitalize()} ({comparison[nutrient_id][0][2]})"
+        for nutrient_id in nutrient_ids
+    ]
+    name_width = max(len(food) for food in foods)
     
+    lines = ["  ".join([" " * name_width] + headers)]
+    for food in foods:
+        row = [cells.get((food, nutrient_id), "-").rjust(len(header))
+               for nutrient_id, header in zip(nutrient_ids, headers)]
+        lines.append("  ".join([food.ljust(name_width)] + row))
+    return "\n".join(lines)
+
+# Foods to compare, with a typical serving of each in grams
+TYPICAL_SERVINGS = {
+    1750340: 182.0,  # Apple, raw, with skin: one medium apple
+    1750341: 118.0,  # Banana, raw: one medium banana
+    1750342: 131.0,  # Orange, raw, all commercial varieties: one medium orange
+}
+
+def main():
     # Initialize the client
-    client = FdcClient(api_key)
+    client = get_client()
     
-    # Get foods to compare
+    # Get foods to compare in a single request
     print("Getting foods to compare...")
-    foods = [
-        client.get_food(1750340),  # Apple, raw, with skin
-        client.get_food(1750341),  # Banana, raw
-        client.get_food(1750342)   # Orange, raw, all commercial varieties
-    ]
+    foods = client.get_foods(list(TYPICAL_SERVINGS))
+    
+    # The batch endpoint returns only the foods it found, in its own order, so
+    # check they all came back and match each one up by its ID
+    missing = set(TYPICAL_SERVINGS) - {food.fdc_id for food in foods}
+    if missing:
+        raise SystemExit(f"Error: foods not found: {', '.join(map(str, sorted(missing)))}")
     
     print(f"Comparing: {', '.join(food.description for food in foods)}")
     
@@ -34,41 +61,23 @@ def main():
     comparison = compare_foods(
         foods,
         nutrient_ids=["vitamin_c", "potassium", "fiber", "sugar"],
-        serving_sizes=[100.0, 100.0, 100.0]  # 100g serving for each
+        serving_sizes=[100.0] * len(foods)  # 100g serving for each
     )
     
     # Print the comparison
     print("\nNutrient Comparison (per 100g):")
-    for nutrient_id, values in comparison.items():
-        if not values:
-            continue
-        
-        # Get the nutrient name and unit from the first value
-        _, _, unit = values[0]
-        
-        print(f"\n{nutrient_id.capitalize()}:")
-        for food, amount, _ in values:
-            print(f"- {food}: {amount:.1f} {unit}")
+    print(format_comparison(comparison))
     
     # Compare with different serving sizes
     print("\nComparing with typical serving sizes:")
     comparison = compare_foods(
         foods,
         nutrient_ids=["vitamin_c", "potassium", "fiber", "sugar"],
-        serving_sizes=[182.0, 118.0, 131.0]  # Medium apple, medium banana, medium orange
+        serving_sizes=[TYPICAL_SERVINGS[food.fdc_id] for food in foods]
     )
     
     print("\nNutrient Comparison (per typical serving):")
-    for nutrient_id, values in comparison.items():
-        if not values:
-            continue
-        
-        # Get the nutrient name and unit from the first value
-        _, _, unit = values[0]
-        
-        print(f"\n{nutrient_id.capitalize()}:")
-        for food, amount, _ in values:
-            print(f"- {food}: {amount:.1f} {unit}")
+    print(format_comparison(comparison))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
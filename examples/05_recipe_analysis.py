@@ -3,23 +3,17 @@
 Example of analyzing a recipe using the USDA FDC API.
 """
 
-import os
-from dotenv import load_dotenv
-from usda_fdc import FdcClient
+from _common import get_client
 from usda_fdc.analysis import DriType, Gender
 from usda_fdc.analysis.recipe import create_recipe, analyze_recipe
+from usda_fdc.client import DEFAULT_POOL_SIZE
+
+# Nutrients to report per serving
+KEY_NUTRIENTS = ("protein", "fiber", "vitamin_c", "potassium")
 
 def main():
-    # Load API key from environment variable
-    load_dotenv()
-    api_key = os.getenv("FDC_API_KEY")
-    
-    if not api_key:
-        print("Error: FDC_API_KEY environment variable not set.")
-        return
-    
     # Initialize the client
-    client = FdcClient(api_key)
+    client = get_client()
     
     # Define a recipe
     recipe_name = "Fruit Salad"
@@ -41,7 +35,8 @@ def main():
         name=recipe_name,
         ingredient_texts=ingredient_texts,
         client=client,
-        servings=2
+        servings=2,
+        max_workers=DEFAULT_POOL_SIZE
     )
     
     # Print recipe information
@@ -69,7 +64,7 @@ def main():
     
     # Print key nutrients
     print("\nKey Nutrients per serving:")
-    for nutrient_id in ["protein", "fiber", "vitamin_c", "potassium"]:
+    for nutrient_id in KEY_NUTRIENTS:
         nutrient_value = per_serving.get_nutrient(nutrient_id)
         if nutrient_value:
             dri_percent = f"{nutrient_value.dri_percent:.1f}%" if nutrient_value.dri_percent is not None else "N/A"
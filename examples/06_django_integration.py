@@ -6,19 +6,13 @@ Note: This example is for illustration purposes and requires Django to be instal
 and properly configured. It's meant to be used within a Django project.
 """
 
-import os
-from dotenv import load_dotenv
+from _common import get_api_key
 
 # This would be in a Django view or management command
 def django_example():
     """Example of using the USDA FDC API with Django integration."""
     # Load API key from environment variable
-    load_dotenv()
-    api_key = os.getenv("FDC_API_KEY")
-    
-    if not api_key:
-        print("Error: FDC_API_KEY environment variable not set.")
-        return
+    api_key = get_api_key()
     
     # In a real Django project, you would import these
     try:
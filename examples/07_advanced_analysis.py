@@ -9,64 +9,98 @@ This example demonstrates:
 - Comparing to dietary reference intakes
 """
 
-import os
-import json
-from dotenv import load_dotenv
-from usda_fdc import FdcClient
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from _common import get_client, write_json
 from usda_fdc.analysis import analyze_food, analyze_foods, DriType, Gender
-from usda_fdc.analysis.recipe import create_recipe, analyze_recipe
+from usda_fdc.client import DEFAULT_POOL_SIZE
+from usda_fdc.analysis.recipe import create_recipe, analyze_recipe, parse_ingredient
 from usda_fdc.analysis.visualization import (
     generate_html_report,
     generate_macronutrient_chart_data,
     generate_dri_chart_data
 )
 
+# Nutrients summed across the day, and each one's column in the per-meal table
+KEY_NUTRIENTS = ("protein", "fiber", "vitamin_c", "calcium", "iron", "vitamin_a")
+KEY_NUTRIENT_COLUMNS = {nutrient_id: i for i, nutrient_id in enumerate(KEY_NUTRIENTS)}
+
+class IngredientCache:
+    """
+    Wraps a client so a food already looked up is not searched for or fetched again.
+    
+    Searches are cached under the query folded to lower case, so "Banana" and
+    "banana " share one request, but the API still receives the query as written.
+    The cache does not merge lookups that miss at the same moment; MealPlan
+    avoids those by resolving each distinct ingredient once before building
+    its recipes.
+    """
+    
+    def __init__(self, client, maxsize=512):
+        self._client = client
+        self._searches = {}
+        self.get_food = functools.lru_cache(maxsize=maxsize)(client.get_food)
+    
+    def search(self, query, **kwargs):
+        """Search for foods, sharing results between spellings of the same query."""
+        key = (query.strip().lower(), tuple(sorted(kwargs.items())))
+        if key not in self._searches:
+            self._searches[key] = self._client.search(query, **kwargs)
+        return self._searches[key]
+
 class MealPlan:
     """Simple meal plan class for demonstration purposes."""
     
     def __init__(self, name, client):
         self.name = name
-        self.client = client
+        self.client = IngredientCache(client)
         self.meals = []
+        self._pending_meals = []
     
     def add_meal(self, name, ingredients):
-        """Add a meal to the plan."""
-        recipe = create_recipe(
-            name=name,
-            ingredient_texts=ingredients,
-            client=self.client,
-            servings=1
+        """Add a meal to the plan. Its ingredients are looked up when the plan is analyzed."""
+        self._pending_meals.append((name, ingredients))
+    
+    def _create_pending_meals(self):
+        """Turn every pending meal into a recipe, looking each distinct ingredient up once."""
+        if not self._pending_meals:
+            return
+        
+        # Resolve the distinct ingredients concurrently to fill the cache; the
+        # recipes below are then built from cached lookups only
+        unique_ingredients = list(dict.fromkeys(
+            text for _, ingredients in self._pending_meals for text in ingredients
+        ))
+        with ThreadPoolExecutor(max_workers=DEFAULT_POOL_SIZE) as executor:
+            list(executor.map(lambda text: parse_ingredient(text, self.client), unique_ingredients))
+        
+        self.meals.extend(
+            create_recipe(name=name, ingredient_texts=ingredients, client=self.client, servings=1)
+            for name, ingredients in self._pending_meals
         )
-        self.meals.append(recipe)
-        return recipe
+        self._pending_meals.clear()
     
     def analyze(self):
         """Analyze the entire meal plan."""
-        meal_analyses = []
-        for meal in self.meals:
-            analysis = analyze_recipe(meal, dri_type=DriType.RDA, gender=Gender.MALE)
-            meal_analyses.append(analysis.per_serving_analysis)
+        self._create_pending_meals()
         
-        return meal_analyses
+        # Analysis is local computation; only the lookups above touch the network
+        return [
+            analyze_recipe(meal, dri_type=DriType.RDA, gender=Gender.MALE).per_serving_analysis
+            for meal in self.meals
+        ]
 
 def main():
-    # Load API key from environment variable
-    load_dotenv()
-    api_key = os.getenv("FDC_API_KEY")
-    
-    if not api_key:
-        print("Error: FDC_API_KEY environment variable not set.")
-        return
-    
     # Initialize the client
-    client = FdcClient(api_key)
+    client = get_client()
     
     # Create a meal plan for a day
     print("Creating a daily meal plan...")
     meal_plan = MealPlan("Daily Plan", client)
     
     # Add breakfast
-    breakfast = meal_plan.add_meal(
+    meal_plan.add_meal(
         "Breakfast",
         [
             "1 cup oatmeal",
@@ -77,7 +111,7 @@ def main():
     )
     
     # Add lunch
-    lunch = meal_plan.add_meal(
+    meal_plan.add_meal(
         "Lunch",
         [
             "2 slices whole wheat bread",
@@ -89,7 +123,7 @@ def main():
     )
     
     # Add dinner
-    dinner = meal_plan.add_meal(
+    meal_plan.add_meal(
         "Dinner",
         [
             "6 oz salmon fillet",
@@ -100,7 +134,7 @@ def main():
     )
     
     # Add snack
-    snack = meal_plan.add_meal(
+    meal_plan.add_meal(
         "Snack",
         [
             "1 apple",
@@ -112,41 +146,49 @@ def main():
     print("Analyzing meal plan...")
     meal_analyses = meal_plan.analyze()
     
-    # Print summary of each meal
-    print("\nMeal Plan Summary:")
+    # Summarize each meal, collecting the lines and printing them at once
+    lines = ["\nMeal Plan Summary:"]
     total_calories = 0
     
     for meal, analysis in zip(meal_plan.meals, meal_analyses):
         calories = analysis.calories_per_serving
         total_calories += calories
-        print(f"\n{meal.name} ({meal.get_weight_per_serving():.0f}g):")
-        print(f"- Calories: {calories:.0f} kcal")
+        lines.append(f"\n{meal.name} ({meal.get_weight_per_serving():.0f}g):")
+        lines.append(f"- Calories: {calories:.0f} kcal")
         
-        # Print macronutrient distribution
-        for macro, percent in analysis.macronutrient_distribution.items():
-            print(f"- {macro.capitalize()}: {percent:.1f}%")
+        # Macronutrient distribution
+        lines.extend(
+            f"- {macro.capitalize()}: {percent:.1f}%"
+            for macro, percent in analysis.macronutrient_distribution.items()
+        )
     
-    print(f"\nTotal daily calories: {total_calories:.0f} kcal")
+    lines.append(f"\nTotal daily calories: {total_calories:.0f} kcal")
+    print("\n".join(lines))
     
     # Analyze key nutrients across the day
-    print("\nKey Nutrient Summary (% of daily DRI):")
-    key_nutrients = ["protein", "fiber", "vitamin_c", "calcium", "iron", "vitamin_a"]
-    
-    for nutrient_id in key_nutrients:
-        total_amount = 0
-        unit = ""
-        dri_percent = 0
-        
-        for analysis in meal_analyses:
-            nutrient_value = analysis.get_nutrient(nutrient_id)
-            if nutrient_value:
-                total_amount += nutrient_value.amount
-                unit = nutrient_value.unit
-                if nutrient_value.dri_percent:
-                    dri_percent += nutrient_value.dri_percent
-        
+    lines = ["\nKey Nutrient Summary (% of daily DRI):"]
+    # Look every key nutrient up once per meal, into a table with a row per
+    # meal and a column per nutrient, and total the columns in the same pass.
+    # The "highest in" queries further down are column operations on the table.
+    nutrient_table = []
+    totals = [0.0] * len(KEY_NUTRIENTS)
+    dri_totals = [0.0] * len(KEY_NUTRIENTS)
+    units = [None] * len(KEY_NUTRIENTS)
+    
+    for analysis in meal_analyses:
+        row = [analysis.get_nutrient(nutrient_id) for nutrient_id in KEY_NUTRIENTS]
+        nutrient_table.append(row)
+        for i, value in enumerate(row):
+            if value:
+                totals[i] += value.amount
+                dri_totals[i] += value.dri_percent or 0.0
+                units[i] = value.unit
+    
+    for nutrient_id, total_amount, dri_percent, unit in zip(KEY_NUTRIENTS, totals, dri_totals, units):
         if total_amount > 0:
-            print(f"- {nutrient_id.capitalize()}: {total_amount:.1f} {unit} ({dri_percent:.1f}% of DRI)")
+            lines.append(f"- {nutrient_id.capitalize()}: {total_amount:.1f} {unit} ({dri_percent:.1f}% of DRI)")
+    
+    print("\n".join(lines))
     
     # Generate visualization for breakfast
     print("\nGenerating visualization for breakfast...")
@@ -156,47 +198,48 @@ def main():
     macro_chart = generate_macronutrient_chart_data(breakfast_analysis)
     dri_chart = generate_dri_chart_data(breakfast_analysis)
     
-    # Save chart data to files
-    with open("breakfast_macro_chart.json", "w") as f:
-        json.dump(macro_chart, f, indent=2)
-    
-    with open("breakfast_dri_chart.json", "w") as f:
-        json.dump(dri_chart, f, indent=2)
+    def write_html_report(path, analysis):
+        with open(path, "w") as f:
+            generate_html_report(analysis, fp=f)
+    
+    # Save the chart data and the HTML report for breakfast. The files are
+    # independent, so write them at the same time; result() re-raises any
+    # error from a write.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        writes = [
+            executor.submit(write_json, "breakfast_macro_chart.json", macro_chart),
+            executor.submit(write_json, "breakfast_dri_chart.json", dri_chart),
+            executor.submit(write_html_report, "breakfast_report.html", breakfast_analysis),
+        ]
+        for write in writes:
+            write.result()
     
     print("Chart data saved to breakfast_macro_chart.json and breakfast_dri_chart.json")
-    
-    # Generate HTML report for breakfast
-    html_report = generate_html_report(breakfast_analysis)
-    with open("breakfast_report.html", "w") as f:
-        f.write(html_report)
-    
     print("HTML report saved to breakfast_report.html")
     
     # Advanced analysis: Find meals high in specific nutrients
     print("\nMeals high in specific nutrients:")
     
+    def highest_in(nutrient_id):
+        """Return (meal index, amount) of the meal richest in a key nutrient."""
+        column = KEY_NUTRIENT_COLUMNS[nutrient_id]
+        amounts = [
+            (i, row[column].amount)
+            for i, row in enumerate(nutrient_table)
+            if row[column]
+        ]
+        return max(amounts, key=itemgetter(1)) if amounts else None
+    
     # Find meal highest in protein
-    protein_amounts = []
-    for i, analysis in enumerate(meal_analyses):
-        protein = analysis.get_nutrient("protein")
-        if protein:
-            protein_amounts.append((i, protein.amount))
-    
-    if protein_amounts:
-        highest_protein = max(protein_amounts, key=lambda x: x[1])
+    highest_protein = highest_in("protein")
+    if highest_protein:
         meal_index, amount = highest_protein
         meal_name = meal_plan.meals[meal_index].name
         print(f"- Highest protein: {meal_name} ({amount:.1f}g)")
     
     # Find meal highest in vitamin C
-    vitc_amounts = []
-    for i, analysis in enumerate(meal_analyses):
-        vitc = analysis.get_nutrient("vitamin_c")
-        if vitc:
-            vitc_amounts.append((i, vitc.amount))
-    
-    if vitc_amounts:
-        highest_vitc = max(vitc_amounts, key=lambda x: x[1])
+    highest_vitc = highest_in("vitamin_c")
+    if highest_vitc:
         meal_index, amount = highest_vitc
         meal_name = meal_plan.meals[meal_index].name
         print(f"- Highest vitamin C: {meal_name} ({amount:.1f}mg)")
@@ -2,36 +2,31 @@
 """
 Example of using the nutrient analysis command-line interface.
 
-This script demonstrates how to use the fdc-nat command-line tool
-by executing it as a subprocess. It's equivalent to running the commands
-directly in the terminal.
+This script demonstrates how to use the fdc-nat command-line tool.
+Each command is run through the tool's own entry point in this process,
+which is equivalent to running it directly in the terminal without paying
+for a new interpreter per command.
 """
 
 import os
-import subprocess
+import shlex
 import tempfile
-from dotenv import load_dotenv
+from _common import get_api_key
+from usda_fdc.analysis.cli import main as fdc_nat
 
 def run_command(command):
-    """Run a command and print its output."""
+    """Run an fdc-nat command line in-process; its output goes to the console."""
     print(f"\n$ {command}")
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
-    print(result.stdout)
-    if result.stderr:
-        print(f"Error: {result.stderr}")
-    return result
+    try:
+        fdc_nat(shlex.split(command)[1:])
+    except SystemExit as e:
+        # fdc-nat exits on errors, after printing them; keep going
+        if e.code:
+            print(f"(exited with status {e.code})")
 
 def main():
-    # Load API key from environment variable
-    load_dotenv()
-    api_key = os.getenv("FDC_API_KEY")
-    
-    if not api_key:
-        print("Error: FDC_API_KEY environment variable not set.")
-        return
-    
-    # Set API key for commands
-    os.environ["FDC_API_KEY"] = api_key
+    # fdc-nat reads the key from the environment, like it would in a shell
+    os.environ["FDC_API_KEY"] = get_api_key()
     
     print("=== USDA FDC Nutrient Analysis Tool Examples ===")
     
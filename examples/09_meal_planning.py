@@ -6,29 +6,37 @@ This script demonstrates how to use the recipe analysis functionality
 to create and analyze a meal plan.
 """
 
-import os
-import json
 import tempfile
 from pathlib import Path
-from dotenv import load_dotenv
-from usda_fdc import FdcClient
+from _common import get_client, write_json
 from usda_fdc.analysis.recipe import create_recipe, analyze_recipe
+from usda_fdc.client import DEFAULT_POOL_SIZE
 from usda_fdc.analysis.dri import DriType, Gender
 
 # Path to the example data directory
 DATA_DIR = Path(__file__).parent / "data"
 
+# Energy per gram of each macronutrient (Atwater general factors), in the
+# order the daily totals are reported
+MACRO_ENERGY = (("protein", 4.0), ("carbs", 4.0), ("fat", 9.0))
+
+# Nutrients charted against their DRI, with their display names
+KEY_NUTRIENTS = (
+    ("protein", "Protein"),
+    ("fiber", "Fiber"),
+    ("vitamin_a", "Vitamin A"),
+    ("vitamin_c", "Vitamin C"),
+    ("vitamin_d", "Vitamin D"),
+    ("calcium", "Calcium"),
+    ("iron", "Iron"),
+    ("potassium", "Potassium"),
+    ("magnesium", "Magnesium"),
+    ("zinc", "Zinc"),
+)
+
 def main():
-    # Load API key from environment variable
-    load_dotenv()
-    api_key = os.getenv("FDC_API_KEY")
-    
-    if not api_key:
-        print("Error: FDC_API_KEY environment variable not set.")
-        return
-    
     # Initialize the client
-    client = FdcClient(api_key)
+    client = get_client()
     
     print("=== Meal Planning Example ===")
     
@@ -44,7 +52,8 @@ def main():
             "2 tbsp almonds, sliced"
         ],
         client=client,
-        servings=1
+        servings=1,
+        max_workers=DEFAULT_POOL_SIZE
     )
     
     # Analyze breakfast
@@ -67,6 +76,7 @@ def main():
         print(f"- {macro.capitalize()}: {percent:.1f}%")
     
     # Save breakfast DRI data for visualization
+    fiber = per_serving.get_nutrient("fiber")
     breakfast_dri_data = {
         "recipe": {
             "name": breakfast.name,
@@ -87,7 +97,7 @@ def main():
                 "protein": per_serving.protein_per_serving,
                 "carbs": per_serving.carbs_per_serving,
                 "fat": per_serving.fat_per_serving,
-                "fiber": per_serving.get_nutrient("fiber").amount if per_serving.get_nutrient("fiber") else 0
+                "fiber": fiber.amount if fiber else 0
             },
             "macronutrient_distribution": per_serving.macronutrient_distribution,
             "dri_percentages": {}
@@ -103,20 +113,7 @@ def main():
     }
     
     # Add DRI percentages for key nutrients
-    key_nutrients = [
-        ("protein", "Protein"),
-        ("fiber", "Fiber"),
-        ("vitamin_a", "Vitamin A"),
-        ("vitamin_c", "Vitamin C"),
-        ("vitamin_d", "Vitamin D"),
-        ("calcium", "Calcium"),
-        ("iron", "Iron"),
-        ("potassium", "Potassium"),
-        ("magnesium", "Magnesium"),
-        ("zinc", "Zinc")
-    ]
-    
-    for nutrient_id, display_name in key_nutrients:
+    for nutrient_id, display_name in KEY_NUTRIENTS:
         nutrient_value = per_serving.get_nutrient(nutrient_id)
         if nutrient_value and nutrient_value.dri_percent is not None:
             breakfast_dri_data["nutrition"]["dri_percentages"][nutrient_id] = nutrient_value.dri_percent
@@ -125,8 +122,7 @@ def main():
     
     # Save the data to a file
     output_path = DATA_DIR / "breakfast_dri_chart.json"
-    with open(output_path, 'w') as f:
-        json.dump(breakfast_dri_data, f, indent=2)
+    write_json(output_path, breakfast_dri_data)
     
     print(f"\nBreakfast DRI data saved to {output_path}")
     print("This data can be used for visualization in the visualization example.")
@@ -144,7 +140,8 @@ def main():
             "1 tbsp balsamic vinegar"
         ],
         client=client,
-        servings=1
+        servings=1,
+        max_workers=DEFAULT_POOL_SIZE
     )
     
     # Analyze lunch
@@ -168,30 +165,25 @@ def main():
     
     # Calculate daily totals
     print("\n=== Daily Totals (Breakfast + Lunch) ===")
-    total_calories = (breakfast_analysis.per_serving_analysis.calories_per_serving + 
-                     lunch_analysis.per_serving_analysis.calories_per_serving)
-    total_protein = (breakfast_analysis.per_serving_analysis.protein_per_serving + 
-                    lunch_analysis.per_serving_analysis.protein_per_serving)
-    total_carbs = (breakfast_analysis.per_serving_analysis.carbs_per_serving + 
-                  lunch_analysis.per_serving_analysis.carbs_per_serving)
-    total_fat = (breakfast_analysis.per_serving_analysis.fat_per_serving + 
-                lunch_analysis.per_serving_analysis.fat_per_serving)
+    meals = (breakfast_analysis.per_serving_analysis, lunch_analysis.per_serving_analysis)
+    total_calories = sum(meal.calories_per_serving for meal in meals)
+    totals = [
+        sum(getattr(meal, f"{macro}_per_serving") for meal in meals)
+        for macro, _ in MACRO_ENERGY
+    ]
     
     print(f"Total Calories: {total_calories:.1f} kcal")
-    print(f"Total Protein: {total_protein:.1f} g")
-    print(f"Total Carbs: {total_carbs:.1f} g")
-    print(f"Total Fat: {total_fat:.1f} g")
+    for (macro, _), grams in zip(MACRO_ENERGY, totals):
+        print(f"Total {macro.capitalize()}: {grams:.1f} g")
     
     # Calculate macronutrient distribution
-    protein_calories = total_protein * 4.0
-    carbs_calories = total_carbs * 4.0
-    fat_calories = total_fat * 9.0
-    total_macro_calories = protein_calories + carbs_calories + fat_calories
+    macro_calories = [grams * factor for (_, factor), grams in zip(MACRO_ENERGY, totals)]
+    total_macro_calories = sum(macro_calories)
     
     print("\nMacronutrient Distribution:")
-    print(f"- Protein: {(protein_calories / total_macro_calories * 100):.1f}%")
-    print(f"- Carbs: {(carbs_calories / total_macro_calories * 100):.1f}%")
-    print(f"- Fat: {(fat_calories / total_macro_calories * 100):.1f}%")
+    if total_macro_calories > 0:
+        for (macro, _), calories in zip(MACRO_ENERGY, macro_calories):
+            print(f"- {macro.capitalize()}: {(calories / total_macro_calories * 100):.1f}%")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,35 +7,34 @@ including charts and HTML reports.
 """
 
 import os
-import json
+import re
 import webbrowser
 import tempfile
 from pathlib import Path
-from dotenv import load_dotenv
-from usda_fdc import FdcClient
+from _common import get_client, read_json, to_json_bytes
 from usda_fdc.analysis import analyze_food, DriType, Gender
 from usda_fdc.analysis.visualization import generate_html_report
 
 # Path to the example data directory
 DATA_DIR = Path(__file__).parent / "data"
 
-def create_dri_chart_html(chart_data):
-    """Create an HTML file with a DRI chart using Chart.js."""
-    html = f"""
+# Page for create_dri_chart_html, with $placeholders for the values filled in
+# per chart
+DRI_CHART_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
         <title>DRI Percentages Chart</title>
         <script src="https://cdn.jsdelivr.net/npm/chart.js@2.9.4/dist/Chart.min.js"></script>
         <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            .container {{ max-width: 800px; margin: 0 auto; }}
-            .chart-container {{ width: 100%; height: 500px; }}
+            body { font-family: Arial, sans-serif; margin: 20px; }
+            .container { max-width: 800px; margin: 0 auto; }
+            .chart-container { width: 100%; height: 500px; }
         </style>
     </head>
     <body>
         <div class="container">
-            <h1>DRI Percentages for {chart_data['recipe']['name']}</h1>
+            <h1>DRI Percentages for $recipe_name</h1>
             <div class="chart-container">
                 <canvas id="driChart"></canvas>
             </div>
@@ -44,56 +43,76 @@ def create_dri_chart_html(chart_data):
         <script>
             // Initialize chart
             var ctx = document.getElementById('driChart').getContext('2d');
-            var chart = new Chart(ctx, {{
+            var chart = new Chart(ctx, {
                 type: 'horizontalBar',
-                data: {{
-                    labels: {json.dumps(chart_data['chart_data']['nutrients'])},
-                    datasets: [{{
+                data: {
+                    labels: $labels,
+                    datasets: [{
                         label: '% of DRI',
-                        data: {json.dumps(chart_data['chart_data']['percentages'])},
-                        backgroundColor: {json.dumps(chart_data['chart_data']['colors'])},
+                        data: $percentages,
+                        backgroundColor: $colors,
                         borderColor: 'rgba(54, 162, 235, 1)',
                         borderWidth: 1
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    scales: {{
-                        xAxes: [{{
-                            ticks: {{
+                    scales: {
+                        xAxes: [{
+                            ticks: {
                                 beginAtZero: true,
                                 max: 100
-                            }}
-                        }}]
-                    }},
-                    title: {{
+                            }
+                        }]
+                    },
+                    title: {
                         display: true,
                         text: 'Nutrient Content (% of DRI)'
-                    }}
-                }}
-            }});
+                    }
+                }
+            });
         </script>
     </body>
     </html>
     """
+
+# The page's static text around those placeholders, split and encoded once so
+# that each chart is a single join of bytes
+DRI_CHART_PARTS = tuple(
+    part.encode('utf-8') for part in re.split(r'\$\w+', DRI_CHART_TEMPLATE)
+)
+
+def write_temp_html(html):
+    """Save encoded HTML to a new temporary file and return its path."""
+    fd, path = tempfile.mkstemp(suffix='.html')
+    # Hand the bytes over in a single write, rather than through a text
+    # wrapper that encodes and flushes in 8 KiB pieces
+    with os.fdopen(fd, 'wb') as f:
+        f.write(html)
+    return path
+
+def create_dri_chart_html(chart_data):
+    """Create an HTML file with a DRI chart using Chart.js."""
+    head, after_name, after_labels, after_percentages, tail = DRI_CHART_PARTS
+    html = b''.join([
+        head,
+        chart_data['recipe']['name'].encode('utf-8'),
+        after_name,
+        to_json_bytes(chart_data['chart_data']['nutrients']),
+        after_labels,
+        to_json_bytes(chart_data['chart_data']['percentages']),
+        after_percentages,
+        to_json_bytes(chart_data['chart_data']['colors']),
+        tail,
+    ])
     
     # Create a temporary HTML file
-    with tempfile.NamedTemporaryFile('w', delete=False, suffix='.html') as f:
-        f.write(html)
-        return f.name
+    return write_temp_html(html)
 
 def main():
-    # Load API key from environment variable
-    load_dotenv()
-    api_key = os.getenv("FDC_API_KEY")
-    
-    if not api_key:
-        print("Error: FDC_API_KEY environment variable not set.")
-        return
-    
     # Initialize the client
-    client = FdcClient(api_key)
+    client = get_client()
     
     print("=== Nutrient Data Visualization Examples ===")
     
@@ -116,9 +135,7 @@ def main():
     html_report = generate_html_report(analysis)
     
     # Save the report to a temporary file and open in browser
-    with tempfile.NamedTemporaryFile('w', delete=False, suffix='.html') as f:
-        f.write(html_report)
-        report_path = f.name
+    report_path = write_temp_html(html_report.encode('utf-8'))
     
     print(f"HTML report generated and saved to {report_path}")
     print("Opening report in browser...")
@@ -129,8 +146,7 @@ def main():
     
     # Load sample data
     sample_data_path = DATA_DIR / "breakfast_dri_chart.json"
-    with open(sample_data_path, 'r') as f:
-        sample_data = json.load(f)
+    sample_data = read_json(sample_data_path)
     
     # Create HTML chart
     chart_path = create_dri_chart_html(sample_data)
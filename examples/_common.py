@@ -0,0 +1,69 @@
+"""
+Setup shared by the example scripts.
+
+Each example needs the same API key and client. Both are built once per
+process, so a script that asks for them repeatedly reads the ``.env`` file and
+opens a connection pool only the first time.
+"""
+
+import functools
+import json
+import os
+import sys
+
+from dotenv import load_dotenv
+from usda_fdc import FdcClient
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=1)
+def get_api_key() -> str:
+    """Return the FDC API key, exiting with a message if it is not set."""
+    # An exported key wins anyway, so only read .env when there is none
+    if not os.getenv("FDC_API_KEY"):
+        load_dotenv()
+    api_key = os.getenv("FDC_API_KEY")
+
+    if not api_key:
+        sys.exit(
+            "Error: FDC_API_KEY environment variable not set.\n"
+            "Please set it or pass your API key directly to FdcClient."
+        )
+
+    return api_key
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> FdcClient:
+    """Return a client for the FDC API, shared by every caller in the process."""
+    return FdcClient(get_api_key())
+
+
+def read_json(path):
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_json(path, data) -> None:
+    """Write data to a file as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+def to_json_bytes(data) -> bytes:
+    """Serialize data to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
@@ -17,9 +17,11 @@ setup(
     ],
     extras_require={
         "django": ["Django>=3.2"],
+        "orjson": ["orjson>=3.6"],
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.12.0",
+            "requests-cache>=1.0",
             "black>=21.5b2",
             "isort>=5.9.1",
             "mypy>=0.812",
@@ -4,78 +4,100 @@ Test fixtures and configuration for the USDA FDC Python Client.
 
 import os
 import sys
+import types
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+def _freeze(value):
+    """Make canned API data read-only, so one test cannot change it for the next."""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 # Mock API key for tests
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_key():
     return "test_api_key"
 
-# Mock client fixture
+# Mock client fixture. The mock goes on this instance only, so other clients
+# are untouched and there is no class attribute to restore afterwards.
 @pytest.fixture
 def mock_client():
     from usda_fdc import FdcClient
     
-    with patch.object(FdcClient, '_make_request') as mock_request:
-        mock_request.return_value = {"mock_data": True}
-        client = FdcClient("test_api_key")
-        yield client
+    client = FdcClient("test_api_key")
+    client._make_request = MagicMock(return_value={"mock_data": True})
+    return client
+
+# Canned API responses. Built once per session and frozen: the client only
+# reads them, so there is no need to rebuild them for every test. They share
+# the pieces below rather than spelling the same foods and nutrients out again.
+
+_PROTEIN = {
+    "nutrient": {
+        "id": 1001,
+        "name": "Protein",
+        "unitName": "g"
+    },
+    "amount": 10.5
+}
+
+_FAT = {
+    "nutrient": {
+        "id": 1002,
+        "name": "Fat",
+        "unitName": "g"
+    },
+    "amount": 5.2
+}
+
+# The two foods as search and list endpoints summarize them
+_LISTED_FOODS = [
+    {
+        "fdcId": 1234,
+        "description": "Test Food 1",
+        "dataType": "Branded"
+    },
+    {
+        "fdcId": 5678,
+        "description": "Test Food 2",
+        "dataType": "Foundation"
+    }
+]
+
+# A food with its nutrients, as the nutrients endpoint returns it
+_FOOD = {
+    "fdcId": 1234,
+    "description": "Test Food",
+    "dataType": "Branded",
+    "foodNutrients": [_PROTEIN, _FAT]
+}
 
 # Mock search response
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_search_response():
-    return {
+    return _freeze({
         "totalHits": 2,
         "currentPage": 1,
         "totalPages": 1,
-        "foods": [
-            {
-                "fdcId": 1234,
-                "description": "Test Food 1",
-                "dataType": "Branded"
-            },
-            {
-                "fdcId": 5678,
-                "description": "Test Food 2",
-                "dataType": "Foundation"
-            }
-        ]
-    }
+        "foods": _LISTED_FOODS
+    })
 
 # Mock food response
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_food_response():
-    return {
-        "fdcId": 1234,
-        "description": "Test Food",
-        "dataType": "Branded",
+    return _freeze({
+        **_FOOD,
         "publicationDate": "2023-01-01",
         "foodClass": "Test Class",
         "foodCategory": {
             "description": "Test Category"
         },
-        "foodNutrients": [
-            {
-                "nutrient": {
-                    "id": 1001,
-                    "name": "Protein",
-                    "unitName": "g"
-                },
-                "amount": 10.5
-            },
-            {
-                "nutrient": {
-                    "id": 1002,
-                    "name": "Fat",
-                    "unitName": "g"
-                },
-                "amount": 5.2
-            }
-        ],
         "foodPortions": [
             {
                 "id": 101,
@@ -86,83 +108,22 @@ def mock_food_response():
                 }
             }
         ]
-    }
+    })
 
 # Mock food list for get_foods
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_foods_list_response():
-    return [
-        {
-            "fdcId": 1234,
-            "description": "Test Food 1",
-            "dataType": "Branded",
-            "foodNutrients": [
-                {
-                    "nutrient": {
-                        "id": 1001,
-                        "name": "Protein",
-                        "unitName": "g"
-                    },
-                    "amount": 10.5
-                }
-            ]
-        },
-        {
-            "fdcId": 5678,
-            "description": "Test Food 2",
-            "dataType": "Foundation",
-            "foodNutrients": [
-                {
-                    "nutrient": {
-                        "id": 1002,
-                        "name": "Fat",
-                        "unitName": "g"
-                    },
-                    "amount": 5.2
-                }
-            ]
-        }
-    ]
+    return _freeze([
+        {**_LISTED_FOODS[0], "foodNutrients": [_PROTEIN]},
+        {**_LISTED_FOODS[1], "foodNutrients": [_FAT]}
+    ])
 
 # Mock nutrients response - this is actually a Food object with nutrients
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_nutrients_response():
-    return {
-        "fdcId": 1234,
-        "description": "Test Food",
-        "dataType": "Branded",
-        "foodNutrients": [
-            {
-                "nutrient": {
-                    "id": 1001,
-                    "name": "Protein",
-                    "unitName": "g"
-                },
-                "amount": 10.5
-            },
-            {
-                "nutrient": {
-                    "id": 1002,
-                    "name": "Fat",
-                    "unitName": "g"
-                },
-                "amount": 5.2
-            }
-        ]
-    }
+    return _freeze(_FOOD)
 
 # Mock list foods response
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_list_foods_response():
-    return [
-        {
-            "fdcId": 1234,
-            "description": "Test Food 1",
-            "dataType": "Branded"
-        },
-        {
-            "fdcId": 5678,
-            "description": "Test Food 2",
-            "dataType": "Foundation"
-        }
-    ]
\ No newline at end of file
+    return _freeze(_LISTED_FOODS)
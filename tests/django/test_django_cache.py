@@ -5,17 +5,14 @@ These tests require Django to be installed.
 Skip these tests if Django is not installed.
 """
 
+import importlib.util
 import pytest
 import sys
 from unittest.mock import patch, MagicMock
 
-# Skip if Django is not installed
-django_installed = False
-try:
-    import django
-    django_installed = True
-except ImportError:
-    pass
+# Skip if Django is not installed. find_spec only looks for the package;
+# the tests import what they need themselves.
+django_installed = importlib.util.find_spec("django") is not None
 
 pytestmark = pytest.mark.skipif(
     not django_installed,
@@ -25,9 +22,6 @@ pytestmark = pytest.mark.skipif(
 @pytest.mark.django
 def test_django_cache():
     """Test Django cache."""
-    if not django_installed:
-        pytest.skip("Django not installed")
-    
     # Import Django cache
     from usda_fdc.django.cache import FdcCache
     
@@ -58,9 +52,6 @@ def test_django_cache():
 @pytest.mark.django
 def test_django_cache_get_food():
     """Test Django cache get_food method."""
-    if not django_installed:
-        pytest.skip("Django not installed")
-    
     # Import Django cache and models
     from usda_fdc.django.cache import FdcCache
     from usda_fdc.django.models import FoodModel
@@ -92,4 +83,22 @@ def test_django_cache_get_food():
             mock_client.get_food.assert_called_once_with(1234)
             
             # Verify that the result is the same as the mock food
-            assert result == mock_food
\ No newline at end of file
+            assert result == mock_food
+
+@pytest.mark.django
+def test_django_cache_get_foods_prefetches_related_rows():
+    """Cached foods must come back with their nutrients and portions in one
+    query each, not two extra queries per food."""
+    from usda_fdc.django.cache import FdcCache
+    
+    with patch('usda_fdc.django.cache.FdcClient'):
+        with patch('usda_fdc.django.cache.FoodModel') as mock_food_model_class:
+            filtered = mock_food_model_class.objects.filter.return_value
+            cached_model = MagicMock(fdc_id=1234)
+            filtered.prefetch_related.return_value = [cached_model]
+            
+            cache = FdcCache(api_key="test_api_key")
+            result = cache.get_foods([1234])
+            
+            filtered.prefetch_related.assert_called_once_with("nutrients", "food_portions")
+            assert result == [cached_model.to_food_object.return_value]
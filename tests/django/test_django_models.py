@@ -5,16 +5,13 @@ These tests require Django to be installed.
 Skip these tests if Django is not installed.
 """
 
+import importlib.util
 import pytest
 import sys
 
-# Skip if Django is not installed
-django_installed = False
-try:
-    import django
-    django_installed = True
-except ImportError:
-    pass
+# Skip if Django is not installed. find_spec only looks for the package;
+# the tests import what they need themselves.
+django_installed = importlib.util.find_spec("django") is not None
 
 pytestmark = pytest.mark.skipif(
     not django_installed,
@@ -24,9 +21,6 @@ pytestmark = pytest.mark.skipif(
 @pytest.mark.django
 def test_django_models():
     """Test Django models."""
-    if not django_installed:
-        pytest.skip("Django not installed")
-    
     # Import Django models
     from usda_fdc.django.models import FoodModel, NutrientModel
     
@@ -20,11 +20,35 @@ pytestmark = pytest.mark.skipif(
     reason="FDC_API_KEY environment variable not set"
 )
 
-@pytest.fixture
-def client():
-    """Create a client with the API key from environment."""
+# Set FDC_TEST_CACHE=1 while developing to replay API responses from a local
+# cache instead of spending rate limit on every run. Off by default, so a
+# normal run still talks to the live API.
+USE_RESPONSE_CACHE = os.environ.get("FDC_TEST_CACHE") == "1"
+
+@pytest.fixture(scope="session")
+def client(pytestconfig):
+    """Create a client with the API key from environment.
+
+    Shared by every test, so they all reuse one connection pool.
+    """
     api_key = os.environ.get("FDC_API_KEY")
-    return FdcClient(api_key)
+    session = None
+    if USE_RESPONSE_CACHE:
+        requests_cache = pytest.importorskip("requests_cache")
+        # Kept under .pytest_cache, so it is ignored by git and cleared by --cache-clear
+        cache_dir = pytestconfig.cache.mkdir("fdc-responses")
+        session = requests_cache.CachedSession(
+            str(cache_dir / "responses"),
+            backend="sqlite",
+            expire_after=3600,
+            cache_control=True,
+        )
+    return FdcClient(api_key, session=session)
+
+@pytest.fixture(scope="session")
+def apple(client):
+    """Apple, raw, with skin, fetched once for every test that reads it."""
+    return client.get_food(1750340)
 
 @pytest.mark.integration
 def test_search_integration(client):
@@ -34,19 +58,20 @@ def test_search_integration(client):
     assert len(results.foods) <= 5
     
 @pytest.mark.integration
-def test_get_food_integration(client):
+def test_get_food_integration(apple):
     """Test get_food with actual API call."""
-    # Apple, raw, with skin
-    food = client.get_food(1750340)
-    assert food.fdc_id == 1750340
-    assert "Apple" in food.description
-    assert len(food.nutrients) > 0
+    assert apple.fdc_id == 1750340
+    assert "Apple" in apple.description
+    assert len(apple.nutrients) > 0
     
 @pytest.mark.integration
-def test_get_nutrients_integration(client):
-    """Test get_nutrients with actual API call."""
-    # Apple, raw, with skin
-    nutrients = client.get_nutrients(1750340)
+def test_get_nutrients_integration(apple):
+    """Test the nutrients of an actual API response.
+
+    get_nutrients() is get_food().nutrients, so this reads the food already
+    fetched rather than requesting it again; the wrapper itself is unit tested.
+    """
+    nutrients = apple.nutrients
     assert len(nutrients) > 0
     assert nutrients[0].name is not None
     assert nutrients[0].amount is not None
@@ -0,0 +1,181 @@
+"""
+Unit tests for the nutrient analysis CLI.
+"""
+
+import argparse
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from usda_fdc.analysis import cli as cli_module
+from usda_fdc.analysis.cli import CachingFdcClient, compare_command, get_client
+from usda_fdc.exceptions import FdcResourceNotFoundError, FdcValidationError
+from usda_fdc.models import Food, Nutrient
+
+
+def _compare_args(fdc_ids):
+    return argparse.Namespace(api_key="test_key", fdc_ids=fdc_ids, nutrients="protein",
+                              serving_size=100.0, dri_type="rda", gender="male", age=30,
+                              format="text", output=None, no_cache=False)
+
+
+def _food(fdc_id):
+    return Food(fdc_id=fdc_id, description=f"Food {fdc_id}", data_type="SR Legacy",
+                nutrients=[Nutrient(id=1003, name="Protein", amount=float(fdc_id), unit_name="g")])
+
+
+@pytest.fixture
+def client():
+    """The client compare_command gets, replaced with a mock for the test."""
+    mock_client = MagicMock()
+    with patch("usda_fdc.analysis.cli.get_client", return_value=mock_client):
+        yield mock_client
+
+
+def test_compare_fetches_foods_concurrently_and_keeps_their_order(client, capsys):
+    """Every request must be in flight at once to get past the barrier, and
+    the first food, the slowest to arrive, must still be listed first."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_food(fdc_id):
+        barrier.wait()
+        time.sleep(0.05 if fdc_id == 1 else 0.0)
+        return _food(fdc_id)
+
+    client.get_food.side_effect = get_food
+
+    compare_command(_compare_args([1, 2, 3]))
+
+    out = capsys.readouterr().out
+    assert "Foods: Food 1, Food 2, Food 3" in out
+    assert out.index("Food 1: 1.0 g") < out.index("Food 2: 2.0 g") < out.index("Food 3: 3.0 g")
+
+
+def test_compare_fails_rather_than_dropping_a_missing_food(client, capsys):
+    def get_food(fdc_id):
+        if fdc_id == 2:
+            raise FdcResourceNotFoundError("Food 2 not found")
+        return _food(fdc_id)
+
+    client.get_food.side_effect = get_food
+
+    with pytest.raises(SystemExit) as excinfo:
+        compare_command(_compare_args([1, 2, 3]))
+
+    assert excinfo.value.code == 1
+    assert "Food 2 not found" in capsys.readouterr().err
+
+
+def test_caching_client_reads_a_food_back_from_disk(tmp_path):
+    """A second run, with a fresh client, must not go back to the API."""
+    payload = {"fdcId": 1750340, "description": "Apples, fuji, with skin, raw",
+               "dataType": "Foundation", "foodNutrients": []}
+
+    first = CachingFdcClient("test_key", cache_dir=str(tmp_path))
+    with patch.object(first, "_make_request", return_value=payload) as make_request:
+        assert first.get_food(1750340).description == payload["description"]
+        first.get_food("1750340")
+    make_request.assert_called_once()
+
+    second = CachingFdcClient("test_key", cache_dir=str(tmp_path))
+    with patch.object(second, "_make_request") as make_request:
+        assert second.get_food(1750340).description == payload["description"]
+    make_request.assert_not_called()
+
+
+def test_no_cache_fetches_again_and_overwrites_the_cached_food(tmp_path):
+    """--no-cache must refresh the cache, or the next normal run would serve
+    the stale copy all over again."""
+    (tmp_path / "1750340.json").write_text(json.dumps(
+        {"fdcId": 1750340, "description": "Stale", "dataType": "Foundation", "foodNutrients": []}))
+    fresh = {"fdcId": 1750340, "description": "Fresh", "dataType": "Foundation", "foodNutrients": []}
+
+    client = CachingFdcClient("test_key", cache_dir=str(tmp_path), refresh=True)
+    with patch.object(client, "_make_request", return_value=fresh) as make_request:
+        assert client.get_food(1750340).description == "Fresh"
+    make_request.assert_called_once()
+
+    assert json.loads((tmp_path / "1750340.json").read_text()) == fresh
+
+
+def test_no_cache_flag_asks_for_a_refreshing_client():
+    get_client.cache_clear()
+    try:
+        assert get_client("test_key", refresh=True).refresh is True
+        assert get_client("test_key").refresh is False
+    finally:
+        get_client.cache_clear()
+
+
+@pytest.mark.parametrize("use_orjson", [
+    pytest.param(True, id="orjson"),
+    pytest.param(False, id="json"),
+])
+def test_json_output_is_the_same_either_way(use_orjson, monkeypatch, tmp_path, capsys):
+    from usda_fdc.analysis import cli
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(cli, "orjson", None)
+    result = {"food": "Apples, fuji", "amount": 0.17, "unit": "µg", "dri": None}
+
+    cli.write_json(result)
+    cli.write_json(result, str(tmp_path / "out.json"))
+
+    assert json.loads(capsys.readouterr().out) == result
+    assert json.loads((tmp_path / "out.json").read_text(encoding="utf-8")) == result
+
+
+def test_html_reports_are_written_as_utf8(tmp_path):
+    from usda_fdc.analysis import analyze_food
+    from usda_fdc.analysis.cli import write_html_report
+    b12 = Nutrient(id=1178, name="Vitamin B-12", amount=0.4, unit_name="µg")
+    analysis = analyze_food(Food(fdc_id=1, description="Milk", data_type="SR Legacy",
+                                 nutrients=[b12]))
+    output = tmp_path / "report.html"
+
+    with patch("usda_fdc.analysis.cli.generate_html_report",
+               wraps=cli_module.generate_html_report) as generate:
+        write_html_report(analysis, str(output))
+
+    assert generate.call_args.kwargs["fp"] is not None
+    assert "0.4 µg" in output.read_bytes().decode("utf-8")
+
+
+@pytest.mark.parametrize("fdc_id", ["../escape", "12/34", "", "1e3", "-5"])
+def test_caching_client_rejects_ids_that_are_not_numbers(fdc_id, tmp_path):
+    client = CachingFdcClient("test_key", cache_dir=str(tmp_path / "foods"))
+
+    with patch.object(client, "_make_request") as make_request:
+        with pytest.raises(FdcValidationError):
+            client.get_food(fdc_id)
+    make_request.assert_not_called()
+
+
+def test_caching_client_files_an_id_under_its_canonical_form(tmp_path):
+    payload = {"fdcId": 123, "description": "Food", "dataType": "Foundation", "foodNutrients": []}
+    client = CachingFdcClient("test_key", cache_dir=str(tmp_path))
+
+    with patch.object(client, "_make_request", return_value=payload) as make_request:
+        client.get_food("0123")
+        client.get_food(123)
+    make_request.assert_called_once()
+
+    assert [p.name for p in tmp_path.iterdir()] == ["123.json"]
+
+
+def test_caching_client_removes_its_temporary_file_when_the_write_fails(tmp_path, monkeypatch):
+    payload = {"fdcId": 123, "description": "Food", "dataType": "Foundation", "foodNutrients": []}
+    client = CachingFdcClient("test_key", cache_dir=str(tmp_path))
+
+    def disk_full(*args, **kwargs):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr("usda_fdc.analysis.cli.json.dump", disk_full)
+    with patch.object(client, "_make_request", return_value=payload):
+        assert client.get_food(123).description == "Food"
+
+    assert list(tmp_path.iterdir()) == []
@@ -2,21 +2,37 @@
 Unit tests for the CLI module.
 """
 
+import argparse
 import pytest
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
-from usda_fdc.cli import main, search_command, food_command, nutrients_command, list_command
+from usda_fdc.cli import main, format_output, search_command, food_command, nutrients_command, list_command
+from usda_fdc.exceptions import FdcApiError
 from usda_fdc.models import SearchResult, SearchResultFood, Food, Nutrient
 
 @pytest.fixture
-def mock_args():
-    """Mock command line arguments."""
-    return MagicMock()
+def make_args():
+    """Build parsed command line arguments, with the options every command shares.
+
+    A real Namespace, unlike a MagicMock, fails on an argument the test forgot.
+    """
+    def _make_args(**overrides):
+        args = dict(api_key="test_key", format="text", page_size=10, page_number=1,
+                    data_type=None)
+        args.update(overrides)
+        return argparse.Namespace(**args)
+    return _make_args
 
 @pytest.fixture
+def patched_fdc_client():
+    """The client each command builds, replaced with a mock for the test."""
+    with patch('usda_fdc.cli.FdcClient') as mock_client_class:
+        yield mock_client_class.return_value
+
+@pytest.fixture(scope="session")
 def mock_search_result(mock_search_response):
-    """Create a SearchResult object from mock response."""
+    """Create a SearchResult object from mock response, once per session."""
     foods = [
         SearchResultFood(
             fdc_id=food["fdcId"],
@@ -33,9 +49,9 @@ def mock_search_result(mock_search_response):
         total_pages=mock_search_response["totalPages"]
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_food_object():
-    """Create a Food object with nutrients."""
+    """Create a Food object with nutrients, once per session."""
     nutrients = [
         Nutrient(id=1001, name="Protein", amount=10.5, unit_name="g"),
         Nutrient(id=1002, name="Fat", amount=5.2, unit_name="g")
@@ -49,57 +65,54 @@ def mock_food_object():
         nutrients=nutrients
     )
 
-def test_search_command(mock_args, mock_client, mock_search_result):
+def test_search_command(make_args, patched_fdc_client, mock_search_result, capsys):
     """Test search_command function."""
-    mock_args.query = "apple"
-    mock_args.page_size = 10
-    mock_args.page_number = 1
-    mock_args.data_type = None
-    mock_args.format = "text"
-    
-    with patch('usda_fdc.cli.FdcClient', return_value=mock_client):
-        with patch.object(mock_client, 'search', return_value=mock_search_result):
-            # Capture stdout
-            with patch('builtins.print') as mock_print:
-                search_command(mock_args)
-                
-                # Verify print was called with expected output
-                mock_print.assert_called()
-
-def test_food_command(mock_args, mock_client, mock_food_object):
+    args = make_args(query="apple")
+    
+    patched_fdc_client.search.return_value = mock_search_result
+    
+    search_command(args)
+    
+    out = capsys.readouterr().out
+    assert "Found 2 results (page 1 of 1)" in out
+    assert "Test Food 1" in out
+
+def test_search_command_error(make_args, patched_fdc_client, capsys):
+    """An API error goes to stderr and exits non-zero."""
+    patched_fdc_client.search.side_effect = FdcApiError("API Error")
+    
+    with pytest.raises(SystemExit) as excinfo:
+        search_command(make_args(query="apple"))
+    
+    assert excinfo.value.code == 1
+    assert capsys.readouterr().err == "Error: API Error\n"
+
+def test_food_command(make_args, patched_fdc_client, mock_food_object, capsys):
     """Test food_command function."""
-    mock_args.fdc_id = 1234
-    mock_args.format = "text"
-    
-    with patch('usda_fdc.cli.FdcClient', return_value=mock_client):
-        with patch.object(mock_client, 'get_food', return_value=mock_food_object):
-            # Capture stdout
-            with patch('builtins.print') as mock_print:
-                food_command(mock_args)
-                
-                # Verify print was called with expected output
-                mock_print.assert_called()
-
-def test_nutrients_command(mock_args, mock_client, mock_food_object):
+    args = make_args(fdc_id=1234)
+    
+    patched_fdc_client.get_food.return_value = mock_food_object
+    
+    food_command(args)
+    
+    out = capsys.readouterr().out
+    assert "Test Food" in out
+
+def test_nutrients_command(make_args, patched_fdc_client, mock_food_object, capsys):
     """Test nutrients_command function."""
-    mock_args.fdc_id = 1234
-    mock_args.format = "text"
-    
-    with patch('usda_fdc.cli.FdcClient', return_value=mock_client):
-        with patch.object(mock_client, 'get_food', return_value=mock_food_object):
-            # Capture stdout
-            with patch('builtins.print') as mock_print:
-                nutrients_command(mock_args)
-                
-                # Verify print was called with expected output
-                mock_print.assert_called()
-
-def test_list_command(mock_args, mock_client):
+    args = make_args(fdc_id=1234)
+    
+    patched_fdc_client.get_food.return_value = mock_food_object
+    
+    nutrients_command(args)
+    
+    out = capsys.readouterr().out
+    assert "Nutrients for Test Food (FDC ID: 1234):" in out
+    assert "  Protein: 10.5 g" in out
+
+def test_list_command(make_args, patched_fdc_client, capsys):
     """Test list_command function."""
-    mock_args.page_size = 10
-    mock_args.page_number = 1
-    mock_args.data_type = None
-    mock_args.format = "text"
+    args = make_args()
     
     # Create mock food objects
     mock_foods = [
@@ -107,14 +120,20 @@ def test_list_command(mock_args, mock_client):
         Food(fdc_id=5678, description="Test Food 2", data_type="Foundation")
     ]
     
-    with patch('usda_fdc.cli.FdcClient', return_value=mock_client):
-        with patch.object(mock_client, 'list_foods', return_value=mock_foods):
-            # Capture stdout
-            with patch('builtins.print') as mock_print:
-                list_command(mock_args)
-                
-                # Verify print was called with expected output
-                mock_print.assert_called()
+    patched_fdc_client.list_foods.return_value = mock_foods
+    
+    list_command(args)
+    
+    out = capsys.readouterr().out
+    assert "Listing 2 foods (page 1):" in out
+    assert "Test Food 2" in out
+
+def test_json_output_reads_model_fields(mock_food_object):
+    """The models may use slots and have no __dict__; JSON output must still work."""
+    data = json.loads(format_output(mock_food_object, "json"))
+    
+    assert data["fdc_id"] == 1234
+    assert data["nutrients"][0]["name"] == "Protein"
 
 def test_main():
     """Test main function."""
@@ -123,4 +142,14 @@ def test_main():
         with patch('argparse.ArgumentParser.parse_args', side_effect=SystemExit(0)):
             with pytest.raises(SystemExit) as excinfo:
                 main()
-            assert excinfo.value.code == 0
\ No newline at end of file
+            assert excinfo.value.code == 0
+
+def test_main_does_not_read_dotenv_when_the_key_is_set():
+    """An exported key wins anyway, so a .env file is not worth a disk read."""
+    with patch.dict('os.environ', {'FDC_API_KEY': 'env_key'}):
+        with patch('usda_fdc.cli.load_dotenv') as mock_load_dotenv:
+            with patch('sys.argv', ['fdc']):
+                with patch('argparse.ArgumentParser.print_help'):
+                    main()
+
+    mock_load_dotenv.assert_not_called()
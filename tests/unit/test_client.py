@@ -2,20 +2,29 @@
 Unit tests for the FdcClient class.
 """
 
+import json
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
+from urllib.parse import parse_qs, urlsplit
 
 import requests
 
-from usda_fdc import FdcClient, FdcApiError, FdcTimeoutError
-from usda_fdc.client import DEFAULT_TIMEOUT
+from usda_fdc import FdcClient, FdcApiError, FdcResourceNotFoundError, FdcTimeoutError
+from usda_fdc.client import (
+    DEFAULT_CONNECT_RETRIES, DEFAULT_CONNECT_TIMEOUT, DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT,
+)
 from usda_fdc.models import Nutrient
 
-def test_client_initialization():
+@pytest.fixture(scope="module")
+def default_client():
+    """A client built with defaults, shared by the tests that only read it."""
+    return FdcClient("test_api_key")
+
+def test_client_initialization(default_client):
     """Test client initialization with API key."""
-    client = FdcClient("test_api_key")
-    assert client.api_key == "test_api_key"
-    assert client.base_url == "https://api.nal.usda.gov/fdc/v1/"
+    assert default_client.api_key == "test_api_key"
+    assert default_client.base_url == "https://api.nal.usda.gov/fdc/v1/"
 
 def test_client_initialization_with_custom_url():
     """Test client initialization with custom API URL."""
@@ -25,54 +34,83 @@ def test_client_initialization_with_custom_url():
 
 def test_search(mock_client, mock_search_response):
     """Test search method."""
-    with patch.object(mock_client, '_make_request', return_value=mock_search_response):
-        results = mock_client.search("apple")
-        assert results.total_hits == 2
-        assert len(results.foods) == 2
-        assert results.foods[0].fdc_id == 1234
-        assert results.foods[0].description == "Test Food 1"
-
-def test_search_with_parameters(mock_client, mock_search_response):
-    """Test search method with additional parameters."""
-    with patch.object(mock_client, '_make_request', return_value=mock_search_response) as mock_request:
-        results = mock_client.search(
-            "apple",
-            data_type=["Branded"],
-            page_size=25,
-            page_number=2,
-            sort_by="dataType.keyword",
-            sort_order="asc"
-        )
-        
-        # Verify the parameters were passed correctly
-        args, kwargs = mock_request.call_args
-        assert kwargs["params"]["query"] == "apple"
-        assert kwargs["params"]["dataType"] == ["Branded"]
-        assert kwargs["params"]["pageSize"] == 25
-        assert kwargs["params"]["pageNumber"] == 2
-        assert kwargs["params"]["sortBy"] == "dataType.keyword"
-        assert kwargs["params"]["sortOrder"] == "asc"
+    mock_client._make_request.return_value = mock_search_response
+
+    results = mock_client.search("apple")
+    assert results.total_hits == 2
+    assert len(results.foods) == 2
+    assert results.foods[0].fdc_id == 1234
+    assert results.foods[0].description == "Test Food 1"
+
+@pytest.mark.parametrize("kwargs, expected_params", [
+    (
+        {},
+        {"query": "apple", "pageSize": 50, "pageNumber": 1}
+    ),
+    (
+        {"data_type": ["Branded"], "page_size": 25, "page_number": 2,
+         "sort_by": "dataType.keyword", "sort_order": "asc"},
+        {"query": "apple", "dataType": ["Branded"], "pageSize": 25, "pageNumber": 2,
+         "sortBy": "dataType.keyword", "sortOrder": "asc"}
+    ),
+    (
+        {"brand_owner": "Acme"},
+        {"query": "apple", "pageSize": 50, "pageNumber": 1, "brandOwner": "Acme"}
+    ),
+], ids=["defaults", "all-filters", "brand-owner"])
+def test_search_with_parameters(mock_client, mock_search_response, kwargs, expected_params):
+    """Test that search passes exactly the parameters it was given, in API names."""
+    mock_client._make_request.return_value = mock_search_response
+
+    mock_client.search("apple", **kwargs)
+
+    mock_client._make_request.assert_called_once_with("foods/search", params=expected_params)
 
 def test_get_food(mock_client, mock_food_response):
     """Test get_food method."""
-    with patch.object(mock_client, '_make_request', return_value=mock_food_response):
-        food = mock_client.get_food(1234)
-        assert food.fdc_id == 1234
-        assert food.description == "Test Food"
-        assert len(food.nutrients) == 2
-        assert food.nutrients[0].name == "Protein"
-        assert food.nutrients[0].amount == 10.5
-        assert food.nutrients[0].unit_name == "g"
+    mock_client._make_request.return_value = mock_food_response
+
+    food = mock_client.get_food(1234)
+    assert food.fdc_id == 1234
+    assert food.description == "Test Food"
+    assert len(food.nutrients) == 2
+    assert food.nutrients[0].name == "Protein"
+    assert food.nutrients[0].amount == 10.5
+    assert food.nutrients[0].unit_name == "g"
 
 def test_get_foods(mock_client, mock_foods_list_response):
     """Test get_foods method."""
-    with patch.object(mock_client, '_make_request', return_value=mock_foods_list_response):
-        foods = mock_client.get_foods([1234, 5678])
-        assert len(foods) == 2
-        assert foods[0].fdc_id == 1234
-        assert foods[0].description == "Test Food 1"
-        assert foods[1].fdc_id == 5678
-        assert foods[1].description == "Test Food 2"
+    mock_client._make_request.return_value = mock_foods_list_response
+
+    foods = mock_client.get_foods([1234, 5678])
+    assert len(foods) == 2
+    assert foods[0].fdc_id == 1234
+    assert foods[0].description == "Test Food 1"
+    assert foods[1].fdc_id == 5678
+    assert foods[1].description == "Test Food 2"
+
+@pytest.mark.parametrize("method, args, kwargs, payload, endpoint, expected_params", [
+    ("get_food", (1234,), {}, "mock_food_response",
+     "food/1234", {"format": "full"}),
+    ("get_food", (1234,), {"format": "abridged", "nutrients": [203, 204]}, "mock_food_response",
+     "food/1234", {"format": "abridged", "nutrients": [203, 204]}),
+    ("get_foods", ([1234, 5678],), {}, "mock_foods_list_response",
+     "foods", {"fdcIds": [1234, 5678], "format": "full"}),
+    ("list_foods", (), {}, "mock_list_foods_response",
+     "foods/list", {"pageSize": 50, "pageNumber": 1}),
+    ("list_foods", (), {"data_type": ["Foundation"], "page_size": 10, "page_number": 2,
+                        "sort_by": "fdcId", "sort_order": "desc"}, "mock_list_foods_response",
+     "foods/list", {"dataType": ["Foundation"], "pageSize": 10, "pageNumber": 2,
+                    "sortBy": "fdcId", "sortOrder": "desc"}),
+], ids=["get_food", "get_food-abridged", "get_foods", "list_foods", "list_foods-all-filters"])
+def test_methods_request_their_endpoint(mock_client, request, method, args, kwargs, payload,
+                                        endpoint, expected_params):
+    """Test each method calls its endpoint with exactly the parameters it was given."""
+    mock_client._make_request.return_value = request.getfixturevalue(payload)
+
+    getattr(mock_client, method)(*args, **kwargs)
+
+    mock_client._make_request.assert_called_once_with(endpoint, params=expected_params)
 
 def test_get_nutrients(mock_client, mock_nutrients_response):
     """Test get_nutrients method."""
@@ -84,10 +122,8 @@ def test_get_nutrients(mock_client, mock_nutrients_response):
             Nutrient(id=1002, name="Fat", amount=5.2, unit_name="g")
         ]
         
-        # Create a mock food object with nutrients
-        mock_food = MagicMock()
-        mock_food.nutrients = nutrients
-        mock_get_food.return_value = mock_food
+        # get_nutrients only reads .nutrients from the food
+        mock_get_food.return_value = SimpleNamespace(nutrients=nutrients)
         
         # Call get_nutrients
         result_nutrients = mock_client.get_nutrients(1234)
@@ -103,18 +139,20 @@ def test_get_nutrients(mock_client, mock_nutrients_response):
 
 def test_list_foods(mock_client, mock_list_foods_response):
     """Test list_foods method."""
-    with patch.object(mock_client, '_make_request', return_value=mock_list_foods_response):
-        foods = mock_client.list_foods()
-        assert len(foods) == 2
-        assert foods[0].fdc_id == 1234
-        assert foods[0].description == "Test Food 1"
+    mock_client._make_request.return_value = mock_list_foods_response
+
+    foods = mock_client.list_foods()
+    assert len(foods) == 2
+    assert foods[0].fdc_id == 1234
+    assert foods[0].description == "Test Food 1"
 
 def test_api_error_handling(mock_client):
     """Test API error handling."""
-    with patch.object(mock_client, '_make_request', side_effect=FdcApiError("API Error")):
-        with pytest.raises(FdcApiError) as excinfo:
-            mock_client.search("apple")
-        assert "API Error" in str(excinfo.value)
+    mock_client._make_request.side_effect = FdcApiError("API Error")
+
+    with pytest.raises(FdcApiError) as excinfo:
+        mock_client.search("apple")
+    assert "API Error" in str(excinfo.value)
 
 # ── Request timeouts ──────────────────────────────────────────────────
 # requests has NO default timeout. Without one, a server that accepts the
@@ -123,10 +161,9 @@ def test_api_error_handling(mock_client):
 # asyncio.wait_for cannot cancel the blocking call underneath — so an
 # unbounded request leaks a thread for the life of the process.
 
-def test_client_has_a_default_timeout():
-    client = FdcClient(api_key="test_key")
-    assert client.timeout == DEFAULT_TIMEOUT
-    assert client.timeout > 0
+def test_client_has_a_default_timeout(default_client):
+    assert default_client.timeout == DEFAULT_TIMEOUT
+    assert default_client.timeout > 0
 
 
 def test_client_timeout_is_configurable():
@@ -134,6 +171,11 @@ def test_client_timeout_is_configurable():
     assert client.timeout == 5.0
 
 
+def _ok_response(payload):
+    """A 200 response from the session, carrying ``payload`` as its JSON body."""
+    return MagicMock(status_code=200, json=MagicMock(return_value=payload))
+
+
 def test_timeout_is_actually_passed_to_the_request():
     """The easy regression: accept a timeout parameter, then forget to use it.
 
@@ -142,15 +184,28 @@ def test_timeout_is_actually_passed_to_the_request():
     """
     client = FdcClient(api_key="test_key", timeout=7.5)
 
-    with patch.object(client.session, "request") as mock_request:
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(return_value={"foods": []}),
-            raise_for_status=MagicMock(),
-        )
+    with patch.object(client.session, "request",
+                      return_value=_ok_response({"foods": []})) as mock_request:
+        client._make_request("foods/search")
+
+    assert mock_request.call_args.kwargs["timeout"] == (DEFAULT_CONNECT_TIMEOUT, 7.5)
+
+
+@pytest.mark.parametrize("timeout, expected_connect", [
+    (60.0, DEFAULT_CONNECT_TIMEOUT),
+    (2.0, 2.0),
+], ids=["capped", "shorter-than-cap"])
+def test_connect_timeout_is_capped(timeout, expected_connect):
+    """Failed connections are retried, connect timeouts included, so each
+    attempt must be short or an unreachable host holds the caller for several
+    full timeouts."""
+    client = FdcClient(api_key="test_key", timeout=timeout)
+
+    with patch.object(client.session, "request",
+                      return_value=_ok_response({"foods": []})) as mock_request:
         client._make_request("foods/search")
 
-    assert mock_request.call_args.kwargs["timeout"] == 7.5
+    assert mock_request.call_args.kwargs["timeout"] == (expected_connect, timeout)
 
 
 def test_timeout_raises_fdc_timeout_error():
@@ -183,6 +238,33 @@ def test_timeout_is_distinguishable_from_other_failures():
     assert not isinstance(exc.value, FdcTimeoutError)
 
 
+def test_session_pools_enough_connections_for_concurrent_callers(default_client):
+    """Threads sharing one client must reuse connections, not queue for them."""
+    adapter = default_client.session.get_adapter(default_client.base_url)
+
+    assert adapter._pool_maxsize == DEFAULT_POOL_SIZE
+    assert adapter._pool_connections == DEFAULT_POOL_SIZE
+
+
+def test_session_retries_connecting_but_not_reading(default_client):
+    """A refused connection is worth retrying; a read timeout must surface
+    after one DEFAULT_TIMEOUT, not several."""
+    retries = default_client.session.get_adapter(default_client.base_url).max_retries
+
+    assert retries.total == DEFAULT_CONNECT_RETRIES
+    assert retries.read is False
+    assert retries.backoff_factor > 0
+
+
+def test_client_uses_a_session_it_is_given():
+    """A caller-supplied session, such as a caching one, carries every request."""
+    session = requests.Session()
+    client = FdcClient(api_key="test_key", session=session)
+
+    assert client.session is session
+    assert session.headers["X-Api-Key"] == "test_key"
+
+
 # ── API key handling ──────────────────────────────────────────────────
 # The key used to travel as a query parameter. requests puts the full URL into
 # its exception messages, so the first connection blip wrote the caller's key
@@ -201,12 +283,8 @@ def test_api_key_is_not_put_in_the_query_string():
     reaches."""
     client = FdcClient(api_key=SECRET)
 
-    with patch.object(client.session, "request") as mock_request:
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(return_value={}),
-            raise_for_status=MagicMock(),
-        )
+    with patch.object(client.session, "request",
+                      return_value=_ok_response({})) as mock_request:
         client._make_request("foods/search")
 
     assert "api_key" not in mock_request.call_args.kwargs["params"]
@@ -236,3 +314,66 @@ def test_api_key_does_not_leak_into_an_http_error_body():
             client._make_request("food/1")
 
     assert SECRET not in str(exc.value)
+
+
+# ── Through a real session ────────────────────────────────────────────
+# The tests above stop at _make_request or session.request. These mount a
+# transport on a real requests.Session instead, so URL joining, query encoding,
+# headers and raise_for_status all run as they would against the API.
+
+class _CannedAdapter(requests.adapters.BaseAdapter):
+    """Answers every request with one canned JSON response, and keeps what was sent."""
+
+    def __init__(self, payload, status=200):
+        super().__init__()
+        self.payload = payload
+        self.status = status
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        response = requests.Response()
+        response.status_code = self.status
+        response._content = json.dumps(self.payload).encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _client_over(adapter):
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return FdcClient(api_key=SECRET, session=session)
+
+
+def test_search_round_trips_through_a_real_session():
+    adapter = _CannedAdapter({
+        "totalHits": 1, "currentPage": 1, "totalPages": 1,
+        "foods": [{"fdcId": 1750340, "description": "Apples, raw", "dataType": "Foundation"}],
+    })
+
+    results = _client_over(adapter).search("apple", page_size=5)
+
+    assert results.total_hits == 1
+    assert results.foods[0].fdc_id == 1750340
+
+    sent = adapter.sent[0]
+    url = urlsplit(sent.url)
+    assert sent.method == "GET"
+    assert url.path == "/fdc/v1/foods/search"
+    assert parse_qs(url.query) == {"query": ["apple"], "pageSize": ["5"], "pageNumber": ["1"]}
+    assert sent.headers["X-Api-Key"] == SECRET
+    assert SECRET not in sent.url
+
+
+def test_an_http_error_from_a_real_session_is_mapped():
+    adapter = _CannedAdapter({"error": "not found"}, status=404)
+
+    with pytest.raises(FdcResourceNotFoundError) as exc:
+        _client_over(adapter).get_food(1)
+
+    assert exc.value.status_code == 404
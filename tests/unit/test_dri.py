@@ -12,7 +12,7 @@ off by a factor of a thousand.
 import pytest
 
 from usda_fdc.models import Food, Nutrient
-from usda_fdc.analysis import analyze_food
+from usda_fdc.analysis import analyze_food, analyze_foods, compare_foods
 from usda_fdc.analysis.dri import DriType, Gender, get_dri, get_dri_value
 
 
@@ -66,6 +66,20 @@ def test_a_missing_dri_type_is_reported_once(caplog):
     assert len(warnings) == 1
 
 
+def test_reloaded_dri_data_is_not_answered_from_stale_lookups(monkeypatch):
+    from usda_fdc.analysis import dri as dri_module
+    assert get_dri_value("iron", DriType.RDA, Gender.MALE, 30).value == 8
+
+    reloaded = {"iron": {"unit": "mg", "male": {"19-50": 9}}}
+    monkeypatch.setattr(dri_module, "_normalize", lambda data: reloaded)
+    dri_module._dri_cache.pop(DriType.RDA.value)
+    try:
+        assert get_dri_value("iron", DriType.RDA, Gender.MALE, 30).value == 9
+    finally:
+        # The next lookup reloads the shipped file
+        dri_module._dri_cache.pop(DriType.RDA.value, None)
+
+
 def test_rda_percentage_is_computed_against_the_rda_unit():
     analysis = analyze_food(_food_with(IRON_MG), serving_size=100.0, dri_type=DriType.RDA)
 
@@ -92,6 +106,13 @@ def test_the_dri_unit_is_exposed_alongside_the_value():
     assert iron.dri_unit == "g"
 
 
+def test_nutrient_lookup_ignores_case():
+    analysis = analyze_food(_food_with(IRON_MG), serving_size=100.0)
+
+    assert analysis.get_nutrient("Iron") is analysis.get_nutrient("iron")
+    assert analysis.get_nutrient("iron") is not None
+
+
 def test_incomparable_units_yield_no_percentage_rather_than_a_wrong_one():
     """Vitamin A in IU cannot be checked against a µg allowance. Reporting
     nothing beats reporting a confident wrong number."""
@@ -114,3 +135,55 @@ def test_age_and_gender_still_select_the_right_rda():
     assert get_dri("iron", DriType.RDA, Gender.FEMALE, 30) == 18
     assert get_dri("iron", DriType.RDA, Gender.FEMALE, 60) == 8
     assert get_dri("iron", DriType.RDA, Gender.MALE, 30) == 8
+
+
+def test_repeated_lookups_share_one_result():
+    """A batch of foods asks for the same DRIs over and over; the answer is
+    worked out once."""
+    first = get_dri_value("iron", DriType.RDA, Gender.FEMALE, 30)
+
+    assert get_dri_value("Iron", DriType.RDA, Gender.FEMALE, 30) is first
+
+
+def test_a_batch_matches_foods_analyzed_one_at_a_time():
+    """analyze_foods resolves each nutrient once for the whole batch; the
+    per-food answers must not change because of it."""
+    calcium_mg = Nutrient(id=1087, name="Calcium, Ca", amount=99.0,
+                          unit_name="mg", nutrient_nbr="301")
+    foods = [_food_with(IRON_MG), _food_with(calcium_mg), _food_with(IRON_MG)]
+    serving_sizes = [100.0, 50.0, 30.0]
+
+    batch = analyze_foods(foods, serving_sizes, DriType.UL)
+
+    for food, serving_size, analysis in zip(foods, serving_sizes, batch):
+        alone = analyze_food(food, serving_size, DriType.UL)
+        assert analysis.nutrients == alone.nutrients
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Protein", "protein"),
+    ("Iron, Fe, heme", "iron"),
+    ("Cholesterol, free of protein", "protein"),
+    ("Caffeine, total", "caffeine_total"),
+], ids=["exact", "qualified", "first-rule-wins", "unmatched"])
+def test_nutrient_names_map_to_standard_ids(name, expected):
+    """Rules are tried in table order, whatever their position in the name."""
+    nutrient = Nutrient(id=None, name=name, amount=1.0, unit_name="mg", nutrient_nbr=None)
+
+    analysis = analyze_food(_food_with(nutrient))
+
+    assert list(analysis.nutrients) == [expected]
+
+
+def test_compare_foods_lists_each_food_that_has_the_nutrient():
+    calcium_mg = Nutrient(id=1087, name="Calcium, Ca", amount=99.0,
+                          unit_name="mg", nutrient_nbr="301")
+    foods = [_food_with(IRON_MG), _food_with(calcium_mg)]
+
+    result = compare_foods(foods, nutrient_ids=["Iron", "calcium"],
+                           serving_sizes=[100.0, 50.0])
+
+    assert result == {
+        "Iron": [("Spinach, baby", 1.261, "mg")],
+        "calcium": [("Spinach, baby", 49.5, "mg")],
+    }
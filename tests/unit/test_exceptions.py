@@ -3,28 +3,27 @@ Unit tests for the exceptions module.
 """
 
 import pytest
-import requests
 
-from usda_fdc.exceptions import FdcApiError, FdcRateLimitError, FdcAuthError
+from usda_fdc.exceptions import (
+    FdcApiError,
+    FdcAuthError,
+    FdcRateLimitError,
+    FdcResourceNotFoundError,
+    FdcTimeoutError,
+    FdcValidationError,
+)
 
-def test_fdc_api_error():
-    """Test FdcApiError exception."""
-    error = FdcApiError("API Error")
-    assert str(error) == "API Error"
-    
-    # Test inheritance
+@pytest.mark.parametrize("cls, parent", [
+    (FdcApiError, Exception),
+    (FdcAuthError, FdcApiError),
+    (FdcRateLimitError, FdcApiError),
+    (FdcTimeoutError, FdcApiError),
+    (FdcValidationError, FdcApiError),
+    (FdcResourceNotFoundError, FdcApiError),
+])
+def test_exception_hierarchy(cls, parent):
+    """Test each exception keeps its message and can be caught as its parent."""
+    error = cls("Something went wrong")
+    assert str(error) == "Something went wrong"
+    assert isinstance(error, parent)
     assert isinstance(error, Exception)
-
-def test_fdc_rate_limit_error():
-    """Test FdcRateLimitError exception."""
-    error = FdcRateLimitError("Rate limit exceeded")
-    assert str(error) == "Rate limit exceeded"
-    assert isinstance(error, FdcApiError)
-    assert isinstance(error, Exception)
-
-def test_fdc_auth_error():
-    """Test FdcAuthError exception."""
-    error = FdcAuthError("Authentication failed")
-    assert str(error) == "Authentication failed"
-    assert isinstance(error, FdcApiError)
-    assert isinstance(error, Exception)
\ No newline at end of file
@@ -180,29 +180,20 @@ def test_nutrient_still_parses_the_full_nested_shape():
     assert nutrient.unit_name == "kcal"
 
 
-def test_abridged_food_keeps_its_nutrients():
+@pytest.mark.parametrize("nutrient_row", [ABRIDGED_NUTRIENT, FULL_NUTRIENT],
+                         ids=["abridged", "full"])
+def test_food_keeps_its_nutrients(nutrient_row):
     """The regression: a real abridged food (fdc_id 171314) has 18 nutrients and
     was parsed into a Food with none, silently. Anyone computing nutrition from
-    it got zeros."""
+    it got zeros. The full shape must keep working alongside it."""
     food = Food.from_api_data({
         "fdcId": 171314,
         "description": "Butter, Clarified butter (ghee)",
         "dataType": "SR Legacy",
-        "foodNutrients": [ABRIDGED_NUTRIENT],
+        "foodNutrients": [nutrient_row],
     })
 
     assert len(food.nutrients) == 1
+    assert food.nutrients[0].name == "Energy"
     assert food.nutrients[0].amount == 900.0
-    assert food.nutrients[0].unit_name == "KCAL"
-
-
-def test_full_food_still_keeps_its_nutrients():
-    food = Food.from_api_data({
-        "fdcId": 171314,
-        "description": "Butter, Clarified butter (ghee)",
-        "dataType": "SR Legacy",
-        "foodNutrients": [FULL_NUTRIENT],
-    })
-
-    assert len(food.nutrients) == 1
-    assert food.nutrients[0].id == 1008
+    assert food.nutrients[0].nutrient_nbr == "208"
@@ -0,0 +1,31 @@
+"""
+Unit tests for the nutrient definitions.
+"""
+
+import pytest
+
+from usda_fdc.analysis.nutrients import get_nutrient_by_name, get_nutrient_by_usda_id
+
+
+@pytest.mark.parametrize("usda_id, expected", [
+    (1089, "iron"),
+    (1008, "energy"),
+    (99999, None),
+])
+def test_get_nutrient_by_usda_id(usda_id, expected):
+    """Test get_nutrient_by_usda_id function."""
+    nutrient = get_nutrient_by_usda_id(usda_id)
+    assert (nutrient.id if nutrient else None) == expected
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("vitamin_c", "vitamin_c"),
+    ("VITAMIN_C", "vitamin_c"),
+    ("Thiamin (B1)", "thiamin"),
+    ("total fat", "fat"),
+    ("unobtainium", None),
+], ids=["key", "key-any-case", "display-name", "display-name-any-case", "unknown"])
+def test_get_nutrient_by_name(name, expected):
+    """Test get_nutrient_by_name function."""
+    nutrient = get_nutrient_by_name(name)
+    assert (nutrient.id if nutrient else None) == expected
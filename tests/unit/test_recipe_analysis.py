@@ -7,33 +7,13 @@ from unittest.mock import patch, MagicMock
 
 from usda_fdc.models import Food, Nutrient
 
-# Mock the recipe module since it might not exist yet
-@pytest.fixture
-def mock_recipe_classes():
-    """Create mock Recipe and Ingredient classes."""
-    class Ingredient:
-        def __init__(self, food, weight_g):
-            self.food = food
-            self.weight_g = weight_g
-    
-    class Recipe:
-        def __init__(self, name, ingredients, servings):
-            self.name = name
-            self.ingredients = ingredients
-            self.servings = servings
-            self.total_weight_g = sum(ingredient.weight_g for ingredient in ingredients)
-        
-        def get_weight_per_serving(self):
-            return self.total_weight_g / self.servings
-    
-    return Recipe, Ingredient
+# Skip the module at collection, not inside each test, if recipe analysis is absent
+recipe_module = pytest.importorskip("usda_fdc.analysis.recipe")
 
-def test_recipe_analysis(mock_recipe_classes):
-    """Test recipe analysis functionality."""
-    Recipe, Ingredient = mock_recipe_classes
-    
-    # Create mock foods
-    apple = Food(
+@pytest.fixture(scope="module")
+def apple():
+    """An apple with its calories and protein; the tests only read it."""
+    return Food(
         fdc_id=1234,
         description="Apple",
         data_type="Foundation",
@@ -42,8 +22,11 @@ def test_recipe_analysis(mock_recipe_classes):
             Nutrient(id=2, name="Protein", amount=0.3, unit_name="g")
         ]
     )
-    
-    banana = Food(
+
+@pytest.fixture(scope="module")
+def banana():
+    """A banana with its calories and protein; the tests only read it."""
+    return Food(
         fdc_id=5678,
         description="Banana",
         data_type="Foundation",
@@ -52,6 +35,10 @@ def test_recipe_analysis(mock_recipe_classes):
             Nutrient(id=2, name="Protein", amount=1.1, unit_name="g")
         ]
     )
+
+def test_recipe_analysis(apple, banana):
+    """Test recipe analysis functionality."""
+    Recipe, Ingredient = recipe_module.Recipe, recipe_module.Ingredient
     
     # Create ingredients
     ingredients = [
@@ -69,46 +56,33 @@ def test_recipe_analysis(mock_recipe_classes):
     assert recipe.total_weight_g == 218
     assert recipe.get_weight_per_serving() == 109
 
-def test_recipe_analysis_with_real_module():
-    """Test recipe analysis with the actual module if it exists."""
-    try:
-        from usda_fdc.analysis.recipe import Recipe, Ingredient
-        
-        # Create mock foods
-        apple = Food(
-            fdc_id=1234,
-            description="Apple",
-            data_type="Foundation",
-            nutrients=[
-                Nutrient(id=1, name="Calories", amount=52, unit_name="kcal"),
-                Nutrient(id=2, name="Protein", amount=0.3, unit_name="g")
-            ]
-        )
-        
-        banana = Food(
-            fdc_id=5678,
-            description="Banana",
-            data_type="Foundation",
-            nutrients=[
-                Nutrient(id=1, name="Calories", amount=89, unit_name="kcal"),
-                Nutrient(id=2, name="Protein", amount=1.1, unit_name="g")
-            ]
-        )
-        
-        # Create ingredients
-        ingredients = [
-            Ingredient(food=apple, weight_g=100),
-            Ingredient(food=banana, weight_g=118)
-        ]
-        
-        # Create recipe
-        recipe = Recipe(name="Fruit Salad", ingredients=ingredients, servings=2)
-        
-        # Test recipe properties
-        assert recipe.name == "Fruit Salad"
-        assert len(recipe.ingredients) == 2
-        assert recipe.servings == 2
-        assert hasattr(recipe, "total_weight_g")
-        assert hasattr(recipe, "get_weight_per_serving")
-    except ImportError:
-        pytest.skip("Recipe analysis module not available")
\ No newline at end of file
+def test_create_recipe_keeps_ingredient_order_when_looking_up_concurrently():
+    """Concurrent lookups must not reorder ingredients or keep unmatched ones."""
+    create_recipe, Ingredient = recipe_module.create_recipe, recipe_module.Ingredient
+    
+    texts = ["100g apple", "50g nothing", "118g banana", "30g oats"]
+    
+    def fake_parse(text, client):
+        if "nothing" in text:
+            return None
+        food = Food(fdc_id=len(text), description=text, data_type="Foundation")
+        return Ingredient(food=food, weight_g=1.0, description=text)
+    
+    with patch("usda_fdc.analysis.recipe.parse_ingredient", side_effect=fake_parse) as parse:
+        recipe = create_recipe("Mix", texts, client=MagicMock(), max_workers=4)
+    
+    assert parse.call_count == 4
+    assert [i.description for i in recipe.ingredients] == ["100g apple", "118g banana", "30g oats"]
+
+def test_create_recipe_rejects_zero_workers():
+    """0 is not "use the default"; only None is."""
+    with pytest.raises(ValueError):
+        recipe_module.create_recipe("Mix", ["100g apple"], client=MagicMock(), max_workers=0)
+
+def test_create_recipe_looks_up_one_by_one_unless_asked():
+    """Threads are opt-in: a caller's client may not be safe to share."""
+    with patch("usda_fdc.analysis.recipe.parse_ingredient", return_value=None), \
+            patch("usda_fdc.analysis.recipe.ThreadPoolExecutor") as executor:
+        recipe_module.create_recipe("Mix", ["100g apple", "118g banana"], client=MagicMock())
+
+    executor.assert_not_called()
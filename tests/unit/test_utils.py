@@ -12,99 +12,75 @@ from usda_fdc.utils import (
     normalize_nutrient_value
 )
 
-def test_parse_unit_and_value():
+@pytest.mark.parametrize("text, expected_value, expected_unit", [
+    ("100 g", 100.0, "g"),
+    ("100g", 100.0, "g"),
+    ("1.5 cups", 1.5, "cups"),
+    ("1/2 cup", 0.5, "cup"),
+], ids=["with-space", "without-space", "decimal", "fraction"])
+def test_parse_unit_and_value(text, expected_value, expected_unit):
     """Test parse_unit_and_value function."""
-    # Test with space between value and unit
-    value, unit = parse_unit_and_value("100 g")
-    assert value == 100.0
-    assert unit == "g"
-    
-    # Test without space
-    value, unit = parse_unit_and_value("100g")
-    assert value == 100.0
-    assert unit == "g"
-    
-    # Test with decimal
-    value, unit = parse_unit_and_value("1.5 cups")
-    assert value == 1.5
-    assert unit == "cups"
-    
-    # Test with fraction
-    value, unit = parse_unit_and_value("1/2 cup")
-    assert value == 0.5
-    assert unit == "cup"
-    
-    # Test with invalid format
+    value, unit = parse_unit_and_value(text)
+    assert value == expected_value
+    assert unit == expected_unit
+
+def test_parse_unit_and_value_invalid():
+    """Test parse_unit_and_value with an invalid format."""
     with pytest.raises(ValueError):
         parse_unit_and_value("invalid")
 
-def test_convert_to_grams():
+@pytest.mark.parametrize("value, unit, expected", [
+    (100.0, "g", 100.0),
+    (1.0, "kg", 1000.0),
+    (1.0, "oz", 28.3),
+    (1.0, "lb", 453.6),
+])
+def test_convert_to_grams(value, unit, expected):
     """Test convert_to_grams function."""
-    # Test with grams
-    assert convert_to_grams(100.0, "g") == 100.0
-    
-    # Test with kilograms
-    assert convert_to_grams(1.0, "kg") == 1000.0
-    
-    # Test with ounces
-    assert round(convert_to_grams(1.0, "oz"), 1) == 28.3
-    
-    # Test with pounds
-    assert round(convert_to_grams(1.0, "lb"), 1) == 453.6
-    
-    # Test with invalid unit
+    assert round(convert_to_grams(value, unit), 1) == expected
+
+def test_convert_to_grams_invalid():
+    """Test convert_to_grams with an invalid unit."""
     with pytest.raises(ValueError):
         convert_to_grams(1.0, "invalid")
 
-def test_convert_to_milliliters():
+@pytest.mark.parametrize("value, unit, expected", [
+    (100.0, "ml", 100.0),
+    (1.0, "l", 1000.0),
+    (1.0, "cup", 236.6),
+    (1.0, "tbsp", 14.8),
+])
+def test_convert_to_milliliters(value, unit, expected):
     """Test convert_to_milliliters function."""
-    # Test with milliliters
-    assert convert_to_milliliters(100.0, "ml") == 100.0
-    
-    # Test with liters
-    assert pytest.approx(convert_to_milliliters(1.0, "l")) == 1000.0
-    
-    # Test with cups
-    assert round(convert_to_milliliters(1.0, "cup"), 1) == 236.6
-    
-    # Test with tablespoons
-    assert round(convert_to_milliliters(1.0, "tbsp"), 1) == 14.8
-    
-    # Test with invalid unit
+    assert round(convert_to_milliliters(value, unit), 1) == expected
+
+def test_convert_to_milliliters_invalid():
+    """Test convert_to_milliliters with an invalid unit."""
     with pytest.raises(ValueError):
         convert_to_milliliters(1.0, "invalid")
 
-def test_convert_measurement():
+@pytest.mark.parametrize("value, from_unit, to_unit, expected", [
+    (100.0, "g", "g", 100.0),
+    (1.0, "kg", "g", 1000.0),
+    (1000.0, "g", "kg", 1.0),
+])
+def test_convert_measurement(value, from_unit, to_unit, expected):
     """Test convert_measurement function."""
-    # Test with same units
-    assert convert_measurement(100.0, "g", "g") == 100.0
-    
-    # Test with different units
-    assert convert_measurement(1.0, "kg", "g") == 1000.0
-    assert pytest.approx(convert_measurement(1000.0, "g", "kg")) == 1.0
-    
-    # Test with incompatible units
+    assert convert_measurement(value, from_unit, to_unit) == pytest.approx(expected)
+
+def test_convert_measurement_incompatible_units():
+    """Test convert_measurement with incompatible units."""
     with pytest.raises(ValueError):
         convert_measurement(1.0, "g", "ml")
 
-def test_normalize_nutrient_value():
+@pytest.mark.parametrize("value, from_unit, to_unit, expected_value, expected_unit", [
+    (100.0, "g", "g", 100.0, "g"),
+    (1000.0, "mg", "g", 1.0, "g"),
+    (100.0, "G", "g", 100.0, "g"),
+    (100.0, "IU", "g", 100.0, "IU"),
+], ids=["same-unit", "convertible", "uppercase", "not-convertible"])
+def test_normalize_nutrient_value(value, from_unit, to_unit, expected_value, expected_unit):
     """Test normalize_nutrient_value function."""
-    # Test with same units
-    value, unit = normalize_nutrient_value(100.0, "g", "g")
-    assert value == 100.0
-    assert unit == "g"
-    
-    # Test with convertible units
-    value, unit = normalize_nutrient_value(1000.0, "mg", "g")
-    assert value == 1.0
-    assert unit == "g"
-    
-    # Test with uppercase units
-    value, unit = normalize_nutrient_value(100.0, "G", "g")
-    assert value == 100.0
-    assert unit == "g"
-    
-    # Test with non-convertible units
-    value, unit = normalize_nutrient_value(100.0, "IU", "g")
-    assert value == 100.0
-    assert unit == "IU"
\ No newline at end of file
+    normalized, unit = normalize_nutrient_value(value, from_unit, to_unit)
+    assert normalized == expected_value
+    assert unit == expected_unit
@@ -2,10 +2,13 @@
 Food nutrient analysis functionality.
 """
 
+import functools
+import operator
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Union, Tuple
 
-from ..models import Food, Nutrient
+from ..models import _DATACLASS_OPTIONS, Food, Nutrient
 from ..utils import convert_measurement
 from .dri import DriType, DriValue, Gender, get_dri, get_dri_value
 
@@ -20,6 +23,18 @@ _FDC_UNIT_ALIASES = {
 }
 
 
+def _unit_factor(from_unit: str, to_unit: str) -> Optional[float]:
+    """How many ``to_unit`` make one ``from_unit``, or None if they cannot be compared.
+
+    The factor itself is memoized by ``convert_measurement``, so each unit pair
+    is only worked out by pint once.
+    """
+    try:
+        return convert_measurement(1.0, from_unit, to_unit)
+    except ValueError:
+        return None
+
+
 def _dri_percent(amount: float, unit: Optional[str], dri: Optional[DriValue]) -> Optional[float]:
     """What percentage of a DRI an amount represents, or None if they cannot be compared.
 
@@ -37,14 +52,17 @@ def _dri_percent(amount: float, unit: Optional[str], dri: Optional[DriValue]) ->
     if not food_unit or not dri_unit:
         return None
 
-    try:
-        comparable = convert_measurement(amount, food_unit, dri_unit)
-    except ValueError:
+    # Most RDAs share the food's unit; only a mismatch needs converting
+    if food_unit == dri_unit:
+        return (amount / dri.value) * 100.0
+
+    factor = _unit_factor(food_unit, dri_unit)
+    if factor is None:
         return None
 
-    return (comparable / dri.value) * 100.0
+    return (amount * factor / dri.value) * 100.0
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class NutrientValue:
     """
     Represents a nutrient value with additional analysis information.
@@ -59,7 +77,7 @@ class NutrientValue:
     # an RDA for iron is 8 mg, its UL is 0.045 g.
     dri_unit: Optional[str] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class NutrientAnalysis:
     """
     Analysis of a food's nutrient content.
@@ -83,7 +101,12 @@ class NutrientAnalysis:
         Returns:
             The nutrient value, or None if not found.
         """
-        return self.nutrients.get(nutrient_id.lower())
+        # Keys are stored lower case, and callers almost always pass them that
+        # way; only fold the case when the exact key misses.
+        value = self.nutrients.get(nutrient_id)
+        if value is None:
+            value = self.nutrients.get(nutrient_id.lower())
+        return value
 
 # FDC reports a food's energy several times over, under the same name:
 #
@@ -131,6 +154,51 @@ def _energy_precedence(nutrient: Nutrient) -> int:
     return len(_ENERGY_KCAL_PRECEDENCE)
 
 
+# Common nutrient names and the standardized IDs they map to. FDC qualifies
+# its names ("Calcium, Ca"), so each is matched as a substring, in this order.
+_NAME_RULES = (
+    ("protein", "protein"),
+    ("total lipid (fat)", "fat"),
+    ("fatty acids, total saturated", "saturated_fat"),
+    ("carbohydrate, by difference", "carbs"),
+    ("fiber, total dietary", "fiber"),
+    ("sugars, total including nlea", "sugar"),
+    ("calcium, ca", "calcium"),
+    ("iron, fe", "iron"),
+    ("sodium, na", "sodium"),
+    ("vitamin c, total ascorbic acid", "vitamin_c"),
+    ("vitamin a, iu", "vitamin_a"),
+    ("cholesterol", "cholesterol"),
+    ("potassium, k", "potassium"),
+)
+
+# Most FDC names that match a rule match it exactly, so try that first
+_EXACT_NAMES = dict(_NAME_RULES)
+
+# An unmatched name becomes its own ID: commas dropped, spaces to underscores
+_NAME_TO_ID = str.maketrans({",": None, " ": "_"})
+
+
+@functools.lru_cache(maxsize=512)
+def _nutrient_id_from_name(name_lower: str) -> str:
+    """Map a lower-cased nutrient name to its standardized ID.
+
+    The same few hundred names recur in every food, so each is worked out once.
+    """
+    exact = _EXACT_NAMES.get(name_lower)
+    if exact is not None:
+        return exact
+
+    for key, value in _NAME_RULES:
+        if key in name_lower:
+            return value
+
+    # If no match, use a simplified version of the name. Interned, like the
+    # literal IDs above, so every analysis keys its dict with the one string
+    # and lookups between them succeed on identity.
+    return sys.intern(name_lower.translate(_NAME_TO_ID))
+
+
 def _get_nutrient_id(nutrient: Nutrient) -> str:
     """
     Get a standardized nutrient ID from a nutrient.
@@ -146,33 +214,9 @@ def _get_nutrient_id(nutrient: Nutrient) -> str:
         # overwrite the kcal row it sits beside.
         if _is_kcal(nutrient):
             return "calories"
-        return f"energy_{(nutrient.unit_name or 'unknown').strip().lower()}"
-
-    # Map common nutrient names to standardized IDs
-    name_map = {
-        "protein": "protein",
-        "total lipid (fat)": "fat",
-        "fatty acids, total saturated": "saturated_fat",
-        "carbohydrate, by difference": "carbs",
-        "fiber, total dietary": "fiber",
-        "sugars, total including nlea": "sugar",
-        "calcium, ca": "calcium",
-        "iron, fe": "iron",
-        "sodium, na": "sodium",
-        "vitamin c, total ascorbic acid": "vitamin_c",
-        "vitamin a, iu": "vitamin_a",
-        "cholesterol": "cholesterol",
-        "potassium, k": "potassium"
-    }
-    
-    # Try to match by name
-    name_lower = nutrient.name.lower()
-    for key, value in name_map.items():
-        if key in name_lower:
-            return value
-    
-    # If no match, use a simplified version of the name
-    return name_lower.replace(",", "").replace(" ", "_")
+        return sys.intern(f"energy_{(nutrient.unit_name or 'unknown').strip().lower()}")
+
+    return _nutrient_id_from_name(nutrient.name.lower())
 
 def analyze_food(
     food: Food,
@@ -194,26 +238,58 @@ def analyze_food(
     Returns:
         A NutrientAnalysis object.
     """
-    # Create analysis object
-    analysis = NutrientAnalysis(
-        food=food,
-        serving_size=serving_size
-    )
-    
+    return _analyze_food(food, serving_size, dri_type, gender, age, {})
+
+def _resolve_nutrient(
+    nutrient: Nutrient,
+    dri_type: DriType,
+    gender: Gender,
+    age: int,
+    resolved: Dict[Tuple[str, Optional[str]], Tuple[str, Optional[DriValue]]]
+) -> Tuple[str, Optional[DriValue]]:
+    """Return a nutrient's standardized ID and DRI, remembering both in ``resolved``.
+
+    The ID depends only on the nutrient's name and unit, and the DRI only on the
+    ID, so foods analyzed together resolve each distinct nutrient row once.
+    """
+    key = (nutrient.name, nutrient.unit_name)
+    entry = resolved.get(key)
+    if entry is None:
+        nutrient_id = _get_nutrient_id(nutrient)
+        entry = (nutrient_id, get_dri_value(nutrient_id, dri_type, gender, age))
+        resolved[key] = entry
+    return entry
+
+def _analyze_food(
+    food: Food,
+    serving_size: float,
+    dri_type: DriType,
+    gender: Gender,
+    age: int,
+    resolved: Dict[Tuple[str, Optional[str]], Tuple[str, Optional[DriValue]]]
+) -> NutrientAnalysis:
+    """Analyze one food, sharing nutrient resolution with the rest of its batch."""
+    # The analysis is built once everything is known, so its dict fields take
+    # the values computed here rather than defaults that are then replaced.
+    nutrients: Dict[str, NutrientValue] = {}
+    # Per-serving amounts of the nutrients the summary fields track; a nutrient
+    # is one of them if its ID is a key here
+    macros = {"protein": 0.0, "fat": 0.0, "carbs": 0.0, "calories": 0.0}
+
+    # Amounts are per 100 g; this is the same for every nutrient of the food
+    scale = serving_size / 100.0
+
     # Rank of the energy row currently holding "calories", so a lower-ranked
     # one cannot displace it.
     calories_rank: Optional[int] = None
 
     # Process nutrients
     for nutrient in food.nutrients:
-        # Get standardized nutrient ID
-        nutrient_id = _get_nutrient_id(nutrient)
+        # Get standardized nutrient ID, and the DRI (with its unit) if any
+        nutrient_id, dri = _resolve_nutrient(nutrient, dri_type, gender, age, resolved)
 
         # Calculate amount for the serving size
-        amount = nutrient.amount * (serving_size / 100.0)
-
-        # Get DRI value if available, and the unit it is expressed in
-        dri = get_dri_value(nutrient_id, dri_type, gender, age)
+        amount = nutrient.amount * scale
 
         # Create nutrient value
         nutrient_value = NutrientValue(
@@ -234,46 +310,56 @@ def analyze_food(
             calories_rank = rank
 
         # Add to nutrients dictionary
-        analysis.nutrients[nutrient_id] = nutrient_value
+        nutrients[nutrient_id] = nutrient_value
 
         # Track macronutrients
-        if nutrient_id == "protein":
-            analysis.protein_per_serving = amount
-        elif nutrient_id == "fat":
-            analysis.fat_per_serving = amount
-        elif nutrient_id == "carbs":
-            analysis.carbs_per_serving = amount
-        elif nutrient_id == "calories":
-            analysis.calories_per_serving = amount
+        if nutrient_id in macros:
+            macros[nutrient_id] = amount
     
+    protein_per_serving = macros["protein"]
+    fat_per_serving = macros["fat"]
+    carbs_per_serving = macros["carbs"]
+    calories_per_serving = macros["calories"]
+
     # Calculate macronutrient distribution
     total_calories = 0.0
     
     # Protein: 4 calories per gram
-    protein_calories = analysis.protein_per_serving * 4.0
+    protein_calories = protein_per_serving * 4.0
     total_calories += protein_calories
     
     # Carbs: 4 calories per gram
-    carb_calories = analysis.carbs_per_serving * 4.0
+    carb_calories = carbs_per_serving * 4.0
     total_calories += carb_calories
     
     # Fat: 9 calories per gram
-    fat_calories = analysis.fat_per_serving * 9.0
+    fat_calories = fat_per_serving * 9.0
     total_calories += fat_calories
     
     # If we don't have macronutrient data, use the calories value
-    if total_calories == 0.0 and analysis.calories_per_serving > 0:
-        total_calories = analysis.calories_per_serving
+    if total_calories == 0.0 and calories_per_serving > 0:
+        total_calories = calories_per_serving
     
     # Calculate percentages
     if total_calories > 0:
-        analysis.macronutrient_distribution = {
+        macronutrient_distribution = {
             "protein": (protein_calories / total_calories) * 100.0 if protein_calories > 0 else 0.0,
             "carbs": (carb_calories / total_calories) * 100.0 if carb_calories > 0 else 0.0,
             "fat": (fat_calories / total_calories) * 100.0 if fat_calories > 0 else 0.0
         }
+    else:
+        macronutrient_distribution = {}
     
-    return analysis
+    return NutrientAnalysis(
+        food=food,
+        serving_size=serving_size,
+        nutrients=nutrients,
+        calories_per_serving=calories_per_serving,
+        protein_per_serving=protein_per_serving,
+        carbs_per_serving=carbs_per_serving,
+        fat_per_serving=fat_per_serving,
+        macronutrient_distribution=macronutrient_distribution
+    )
 
 def analyze_foods(
     foods: List[Food],
@@ -303,12 +389,17 @@ def analyze_foods(
     if len(serving_sizes) != len(foods):
         raise ValueError("Number of serving sizes must match number of foods")
     
-    # Analyze each food
+    # Analyze each food in one pass, resolving every distinct nutrient row once
+    # for the whole batch rather than once per food
+    resolved: Dict[Tuple[str, Optional[str]], Tuple[str, Optional[DriValue]]] = {}
     return [
-        analyze_food(food, serving_size, dri_type, gender, age)
+        _analyze_food(food, serving_size, dri_type, gender, age, resolved)
         for food, serving_size in zip(foods, serving_sizes)
     ]
 
+# Reads both fields of a NutrientValue in one C-level call
+_amount_and_unit = operator.attrgetter("amount", "unit")
+
 def compare_foods(
     foods: List[Food],
     nutrient_ids: Optional[List[str]] = None,
@@ -343,15 +434,18 @@ def compare_foods(
         nutrient_id: [] for nutrient_id in nutrient_ids
     }
     
+    # Nutrient keys are always lower case, so fold each requested ID once here
+    # rather than letting get_nutrient retry every miss for every food
+    lookups = [(nutrient_id, nutrient_id.lower()) for nutrient_id in nutrient_ids]
+
     # Compare nutrients
     for analysis in analyses:
-        for nutrient_id in nutrient_ids:
-            nutrient_value = analysis.get_nutrient(nutrient_id)
-            if nutrient_value:
-                result[nutrient_id].append((
-                    analysis.food.description,
-                    nutrient_value.amount,
-                    nutrient_value.unit
-                ))
+        description = analysis.food.description
+        nutrients = analysis.nutrients
+        for nutrient_id, key in lookups:
+            nutrient_value = nutrients.get(key)
+            if nutrient_value is not None:
+                amount, unit = _amount_and_unit(nutrient_value)
+                result[nutrient_id].append((description, amount, unit))
     
     return result
\ No newline at end of file
@@ -6,20 +6,213 @@ import os
 import sys
 import json
 import argparse
-from typing import List, Optional, Dict, Any
+import functools
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Union
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .. import __version__
-from ..client import FdcClient
-from .analysis import analyze_food, compare_foods
+from ..client import FdcClient, DEFAULT_POOL_SIZE
+from ..exceptions import FdcValidationError
+from ..models import Food
+from .analysis import NutrientAnalysis, analyze_food, compare_foods
 from .dri import DriType, Gender
 from .recipe import create_recipe, analyze_recipe
 from .visualization import generate_html_report
 
+def food_cache_dir() -> str:
+    """Directory the CLI keeps fetched foods in, under the user's cache directory."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "usda_fdc", "foods")
+
+class CachingFdcClient(FdcClient):
+    """
+    An FdcClient that keeps the foods it fetches on disk.
+    
+    A food's data does not change between one run of the tool and the next,
+    and users tend to run it over and over on the same foods while they adjust
+    a recipe or a comparison. Each food is fetched once and read back from
+    ``food_cache_dir()`` afterwards, and from memory within a run.
+    
+    Only plain ``get_food(fdc_id)`` calls are cached; asking for an abridged
+    format or a subset of nutrients goes to the API as usual.
+    
+    With ``refresh`` set, foods are always fetched from the API and the cached
+    copies are overwritten with what comes back.
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        refresh: bool = False,
+        **kwargs
+    ):
+        super().__init__(api_key, **kwargs)
+        self.cache_dir = cache_dir or food_cache_dir()
+        self.refresh = refresh
+        self._foods: Dict[str, Food] = {}
+    
+    def get_food(
+        self,
+        fdc_id: Union[str, int],
+        format: str = "full",
+        nutrients: Optional[List[int]] = None
+    ) -> Food:
+        if format != "full" or nutrients:
+            return super().get_food(fdc_id, format=format, nutrients=nutrients)
+        
+        key = self._cache_key(fdc_id)
+        food = self._foods.get(key)
+        if food is None:
+            food = Food.from_api_data(self._food_data(key))
+            self._foods[key] = food
+        return food
+    
+    @staticmethod
+    def _cache_key(fdc_id: Union[str, int]) -> str:
+        """
+        The canonical form of an FDC ID, used to name its cache file.
+        
+        Parsing the ID means "0123" and 123 share one entry, and that nothing
+        but digits ever reaches a path under the cache directory.
+        
+        Raises:
+            FdcValidationError: If the ID is not a non-negative integer.
+        """
+        text = str(fdc_id).strip()
+        if not text.isdecimal():
+            raise FdcValidationError(f"Invalid FDC ID: {fdc_id!r}")
+        return str(int(text))
+    
+    def _food_data(self, fdc_id: str) -> Dict[str, Any]:
+        """The API's data for a food, from the cache directory if it is there."""
+        path = os.path.join(self.cache_dir, f"{fdc_id}.json")
+        if not self.refresh:
+            try:
+                with open(path, "r") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                # Not cached yet, or a file we cannot use; fetch it again
+                pass
+        
+        data = self._make_request(f"food/{fdc_id}", params={"format": "full"})
+        
+        # Write to a temporary file and move it into place, so concurrent
+        # fetches of the same food never leave a half-written file behind.
+        # A cache that cannot be written is no reason to fail the command.
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return data
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Out of space, say; do not leave the partial file behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        
+        return data
+
+# json.dump hands the file one small chunk per token, and the HTML report
+# arrives a table row at a time; a larger buffer turns those into far fewer
+# writes to disk
+OUTPUT_BUFFER_SIZE = 64 * 1024
+
+def write_json(result: Dict[str, Any], output: Optional[str] = None) -> None:
+    """
+    Write a command's result as indented JSON, to a file or to stdout.
+    
+    orjson serializes several times faster than the json module, so it is
+    used when it is installed. Its output is the same JSON, except that
+    non-ASCII characters (the µ in µg) are written as UTF-8 rather than
+    escaped.
+    
+    Args:
+        result: The JSON-serializable result.
+        output: The file to write to, or None for stdout.
+    """
+    if orjson is None:
+        # json.dump writes the encoder's chunks as they are produced, so the
+        # whole document is never held as one string
+        if output:
+            with open(output, 'w', encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+                json.dump(result, f, indent=2)
+        else:
+            json.dump(result, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        return
+    
+    # orjson has no incremental writer: the document is built as one bytes
+    # object, so at least avoid copying it again to append the newline
+    data = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+    if output:
+        with open(output, 'wb') as f:
+            f.write(data)
+        return
+    
+    # Write the bytes straight through when stdout has a binary buffer,
+    # flushing first so the JSON lands after anything already printed
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(data.decode("utf-8"))
+    else:
+        sys.stdout.flush()
+        buffer.write(data)
+        buffer.write(b"\n")
+        buffer.flush()
+
+def write_html_report(analysis: NutrientAnalysis, output: Optional[str] = None) -> None:
+    """
+    Write the HTML report for an analysis to a file, or to stdout.
+    
+    A file gets the report piece by piece as it is generated, as UTF-8
+    whatever the locale, since the report carries units such as µg that a
+    narrower default encoding cannot hold.
+    
+    Args:
+        analysis: The analysis to report on.
+        output: The file to write to, or None for stdout.
+    """
+    if output:
+        with open(output, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+            generate_html_report(analysis, fp=f)
+    else:
+        print(generate_html_report(analysis))
+
+@functools.lru_cache(maxsize=None)
+def get_client(api_key: str, refresh: bool = False) -> CachingFdcClient:
+    """
+    Get the client for an API key, shared by every command run in this process.
+    
+    Running several commands through main() in one process, as example 08
+    does, then reuses one connection pool instead of opening a new one each.
+    
+    Args:
+        api_key: The FDC API key.
+        refresh: Whether to fetch every food from the API, replacing the
+            copies kept on disk, rather than reading those copies.
+        
+    Returns:
+        An FdcClient for the key.
+    """
+    return CachingFdcClient(api_key, refresh=refresh)
+
 def analyze_command(args: argparse.Namespace) -> None:
     """Handle analyze command."""
-    client = FdcClient(args.api_key)
+    client = get_client(args.api_key, refresh=args.no_cache)
     
     try:
         # Get the food
@@ -63,21 +256,11 @@ def analyze_command(args: argparse.Namespace) -> None:
                 }
             }
             
-            if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump(result, f, indent=2)
-            else:
-                print(json.dumps(result, indent=2))
+            write_json(result, args.output)
         
         elif args.format == "html":
             # Generate HTML report
-            html = generate_html_report(analysis)
-            
-            if args.output:
-                with open(args.output, 'w') as f:
-                    f.write(html)
-            else:
-                print(html)
+            write_html_report(analysis, args.output)
         
         else:  # text format
             print(f"Nutrient Analysis: {food.description}")
@@ -111,11 +294,15 @@ def analyze_command(args: argparse.Namespace) -> None:
 
 def compare_command(args: argparse.Namespace) -> None:
     """Handle compare command."""
-    client = FdcClient(args.api_key)
+    client = get_client(args.api_key, refresh=args.no_cache)
     
     try:
-        # Get the foods
-        foods = [client.get_food(fdc_id) for fdc_id in args.fdc_ids]
+        # Get the foods, concurrently since each is a round trip to the API.
+        # map keeps the order of fdc_ids, and re-raises the first failure
+        # rather than leaving a food out of the comparison.
+        workers = max(1, min(DEFAULT_POOL_SIZE, len(args.fdc_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            foods = list(executor.map(client.get_food, args.fdc_ids))
         
         # Parse nutrient IDs
         nutrient_ids = args.nutrients.split(",") if args.nutrients else None
@@ -156,11 +343,7 @@ def compare_command(args: argparse.Namespace) -> None:
                 }
             }
             
-            if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump(result, f, indent=2)
-            else:
-                print(json.dumps(result, indent=2))
+            write_json(result, args.output)
         
         else:  # text format
             print(f"Food Comparison (per {args.serving_size}g):")
@@ -181,7 +364,7 @@ def compare_command(args: argparse.Namespace) -> None:
 
 def recipe_command(args: argparse.Namespace) -> None:
     """Handle recipe command."""
-    client = FdcClient(args.api_key)
+    client = get_client(args.api_key, refresh=args.no_cache)
     
     try:
         # Get ingredients
@@ -201,7 +384,8 @@ def recipe_command(args: argparse.Namespace) -> None:
             name=args.name,
             ingredient_texts=ingredients,
             client=client,
-            servings=args.servings
+            servings=args.servings,
+            max_workers=DEFAULT_POOL_SIZE
         )
         
         # Analyze the recipe
@@ -254,21 +438,11 @@ def recipe_command(args: argparse.Namespace) -> None:
                 }
             }
             
-            if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump(result, f, indent=2)
-            else:
-                print(json.dumps(result, indent=2))
+            write_json(result, args.output)
         
         elif args.format == "html":
             # Generate HTML report
-            html = generate_html_report(analysis.per_serving_analysis)
-            
-            if args.output:
-                with open(args.output, 'w') as f:
-                    f.write(html)
-            else:
-                print(html)
+            write_html_report(analysis.per_serving_analysis, args.output)
         
         else:  # text format
             print(f"Recipe Analysis: {recipe.name}")
@@ -308,10 +482,17 @@ def recipe_command(args: argparse.Namespace) -> None:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-def main() -> None:
-    """Main entry point for the CLI."""
-    # Load environment variables from .env file
-    load_dotenv()
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for the CLI.
+    
+    Args:
+        argv: Command-line arguments, without the program name. Defaults to
+            ``sys.argv[1:]``; pass a list to run a command in-process.
+    """
+    # Load environment variables from .env file, unless the key is already set
+    if not os.environ.get("FDC_API_KEY"):
+        load_dotenv()
     
     # Create the top-level parser
     parser = argparse.ArgumentParser(
@@ -328,6 +509,11 @@ def main() -> None:
         default=os.environ.get("FDC_API_KEY"),
         help="FDC API key (can also be set via FDC_API_KEY environment variable)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch every food from the API and refresh the local cache with it"
+    )
     
     # Create subparsers for commands
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
@@ -371,7 +557,7 @@ def main() -> None:
     recipe_parser.set_defaults(func=recipe_command)
     
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Check if API key is provided
     if not args.api_key:
@@ -5,6 +5,7 @@ Dietary Reference Intake (DRI) data and utilities.
 import os
 import json
 import logging
+import functools
 from enum import Enum
 from typing import Dict, NamedTuple, Optional, Any, Union
 
@@ -130,6 +131,8 @@ def _load_dri_data(dri_type: DriType) -> Dict[str, Any]:
         data = {}
 
     _dri_cache[dri_type.value] = data
+    # Lookups memoized against the previous data for this type would be stale
+    _lookup_dri_value.cache_clear()
     return data
 
 
@@ -154,9 +157,26 @@ def get_dri_value(
     Returns:
         The DRI and its unit, or None if there is none for this nutrient.
     """
-    nutrient_id = str(nutrient_id).lower()
-
-    dri_data = _load_dri_data(dri_type)
+    # Loading stays outside the memoized lookup, so a missing file is still
+    # reported even when the lookup itself is answered from the cache.
+    _load_dri_data(dri_type)
+    return _lookup_dri_value(str(nutrient_id).lower(), dri_type, gender, age)
+
+
+# Every food in a batch asks for the same (nutrient, type, gender, age) tuples,
+# so the age-range scan below is answered once per tuple rather than once per
+# nutrient per food. DriValue is a tuple, so sharing cached results is safe.
+# _load_dri_data clears this cache whenever it stores data, so a reload is
+# never answered from lookups made against what it replaced.
+@functools.lru_cache(maxsize=1024)
+def _lookup_dri_value(
+    nutrient_id: str,
+    dri_type: DriType,
+    gender: Gender,
+    age: int
+) -> Optional[DriValue]:
+    """Find the DRI for a nutrient in already-loaded data."""
+    dri_data = _dri_cache.get(dri_type.value, {})
 
     if nutrient_id not in dri_data:
         return None
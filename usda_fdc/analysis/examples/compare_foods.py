@@ -11,8 +11,9 @@ from usda_fdc.analysis import compare_foods
 
 def main():
     """Main function."""
-    # Load environment variables
-    load_dotenv()
+    # Load environment variables, unless the key is already exported
+    if not os.getenv("FDC_API_KEY"):
+        load_dotenv()
     api_key = os.getenv("FDC_API_KEY")
     
     if not api_key:
@@ -8,12 +8,14 @@ from dotenv import load_dotenv
 from usda_fdc import FdcClient
 from usda_fdc.analysis import DriType, Gender
 from usda_fdc.analysis.recipe import create_recipe, analyze_recipe
+from usda_fdc.client import DEFAULT_POOL_SIZE
 
 
 def main():
     """Main function."""
-    # Load environment variables
-    load_dotenv()
+    # Load environment variables, unless the key is already exported
+    if not os.getenv("FDC_API_KEY"):
+        load_dotenv()
     api_key = os.getenv("FDC_API_KEY")
     
     if not api_key:
@@ -38,7 +40,8 @@ def main():
         name=recipe_name,
         ingredient_texts=ingredient_texts,
         client=client,
-        servings=2
+        servings=2,
+        max_workers=DEFAULT_POOL_SIZE
     )
     
     # Analyze the recipe
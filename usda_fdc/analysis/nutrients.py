@@ -154,6 +154,19 @@ NUTRIENT_GROUPS: Dict[str, List[str]] = {
 }
 
 
+# Lookup indexes over NUTRIENTS, so resolving a nutrient is a dict hit rather
+# than a scan of every definition. Where two nutrients would claim the same
+# key, the first one defined keeps it, as the scans it replaces did.
+_BY_USDA_ID: Dict[int, Nutrient] = {}
+_BY_NAME_LOWER: Dict[str, Nutrient] = {}
+for _nutrient in NUTRIENTS.values():
+    if _nutrient.usda_id is not None:
+        _BY_USDA_ID.setdefault(_nutrient.usda_id, _nutrient)
+    _BY_NAME_LOWER.setdefault(_nutrient.name.lower(), _nutrient)
+    _BY_NAME_LOWER.setdefault(_nutrient.display_name.lower(), _nutrient)
+del _nutrient
+
+
 def get_nutrient_by_usda_id(usda_id: int) -> Optional[Nutrient]:
     """
     Get a nutrient by its USDA ID.
@@ -164,10 +177,7 @@ def get_nutrient_by_usda_id(usda_id: int) -> Optional[Nutrient]:
     Returns:
         The nutrient if found, None otherwise.
     """
-    for nutrient in NUTRIENTS.values():
-        if nutrient.usda_id == usda_id:
-            return nutrient
-    return None
+    return _BY_USDA_ID.get(usda_id)
 
 
 def get_nutrient_by_name(name: str) -> Optional[Nutrient]:
@@ -184,10 +194,5 @@ def get_nutrient_by_name(name: str) -> Optional[Nutrient]:
     if name in NUTRIENTS:
         return NUTRIENTS[name]
     
-    # Try case-insensitive match
-    name_lower = name.lower()
-    for nutrient in NUTRIENTS.values():
-        if nutrient.name.lower() == name_lower or nutrient.display_name.lower() == name_lower:
-            return nutrient
-    
-    return None
\ No newline at end of file
+    # Try case-insensitive match, on the name or the display name
+    return _BY_NAME_LOWER.get(name.lower())
\ No newline at end of file
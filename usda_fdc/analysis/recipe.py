@@ -3,6 +3,7 @@ Recipe analysis functionality.
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Union, Tuple
 
@@ -11,6 +12,35 @@ from ..models import Food, Nutrient
 from .analysis import analyze_food, NutrientAnalysis
 from .dri import DriType, Gender
 
+# An ingredient line: a quantity, an optional unit, then the food
+# ("1/4 cup almonds", "2 eggs"). Compiled once; every ingredient goes through it.
+_QUANTITY_PATTERN = re.compile(r'^([\d./]+)\s*([a-zA-Z]+)?\s+(.+)$')
+
+# Default weights in grams for common units, used when a food has no portion
+# matching the unit
+_UNIT_WEIGHTS = {
+    "cup": 240.0,
+    "cups": 240.0,
+    "tbsp": 15.0,
+    "tablespoon": 15.0,
+    "tablespoons": 15.0,
+    "tsp": 5.0,
+    "teaspoon": 5.0,
+    "teaspoons": 5.0,
+    "oz": 28.35,
+    "ounce": 28.35,
+    "ounces": 28.35,
+    "lb": 453.59,
+    "pound": 453.59,
+    "pounds": 453.59,
+    "piece": 100.0,
+    "pieces": 100.0,
+    "item": 100.0,
+    "items": 100.0,
+    "slice": 30.0,
+    "slices": 30.0
+}
+
 @dataclass
 class Ingredient:
     """
@@ -71,8 +101,7 @@ def parse_ingredient(
         An Ingredient object, or None if parsing failed.
     """
     # Extract quantity and unit if present
-    quantity_pattern = r'^([\d./]+)\s*([a-zA-Z]+)?\s+(.+)$'
-    match = re.match(quantity_pattern, text)
+    match = _QUANTITY_PATTERN.match(text)
     
     if match:
         quantity_str, unit, food_name = match.groups()
@@ -126,46 +155,24 @@ def estimate_weight(food: Food, quantity: float, unit: str) -> float:
     Returns:
         The estimated weight in grams.
     """
+    unit = unit.lower()
+    
     # Check if the unit is already grams
-    if unit.lower() in ["g", "gram", "grams"]:
+    if unit in ("g", "gram", "grams"):
         return quantity
     
     # Check if the unit is kilograms
-    if unit.lower() in ["kg", "kilogram", "kilograms"]:
+    if unit in ("kg", "kilogram", "kilograms"):
         return quantity * 1000.0
     
     # Check if the food has portions that match the unit
     for portion in food.food_portions:
-        if portion.measure_unit and portion.measure_unit.lower() == unit.lower():
+        if portion.measure_unit and portion.measure_unit.lower() == unit:
             return quantity * portion.gram_weight
     
-    # Default weights for common units
-    unit_weights = {
-        "cup": 240.0,
-        "cups": 240.0,
-        "tbsp": 15.0,
-        "tablespoon": 15.0,
-        "tablespoons": 15.0,
-        "tsp": 5.0,
-        "teaspoon": 5.0,
-        "teaspoons": 5.0,
-        "oz": 28.35,
-        "ounce": 28.35,
-        "ounces": 28.35,
-        "lb": 453.59,
-        "pound": 453.59,
-        "pounds": 453.59,
-        "piece": 100.0,
-        "pieces": 100.0,
-        "item": 100.0,
-        "items": 100.0,
-        "slice": 30.0,
-        "slices": 30.0
-    }
-    
     # Use default weight if available
-    if unit.lower() in unit_weights:
-        return quantity * unit_weights[unit.lower()]
+    if unit in _UNIT_WEIGHTS:
+        return quantity * _UNIT_WEIGHTS[unit]
     
     # If no match, assume 100g per unit
     return quantity * 100.0
@@ -175,27 +182,44 @@ def create_recipe(
     ingredient_texts: List[str],
     client: FdcClient,
     servings: int = 1,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    max_workers: int = 1
 ) -> Recipe:
     """
     Create a recipe from ingredient descriptions.
     
+    Each ingredient costs a search and a food request. They are looked up one
+    by one unless ``max_workers`` allows more, in which case they are looked
+    up concurrently and the client must be safe to share between threads.
+    Either way the ingredients keep the order of ``ingredient_texts``.
+    
     Args:
         name: The name of the recipe.
         ingredient_texts: List of ingredient descriptions.
         client: The FDC client to use for food lookup.
         servings: The number of servings the recipe makes.
         description: Optional description of the recipe.
+        max_workers: Maximum number of concurrent lookups. Defaults to 1,
+            one at a time. DEFAULT_POOL_SIZE matches the connection pool of
+            an FdcClient's own session.
         
     Returns:
         A Recipe object.
+    
+    Raises:
+        ValueError: If max_workers is less than 1.
     """
-    ingredients = []
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    workers = max(1, min(max_workers, len(ingredient_texts)))
+    
+    if workers == 1:
+        parsed = [parse_ingredient(text, client) for text in ingredient_texts]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(lambda text: parse_ingredient(text, client), ingredient_texts))
     
-    for text in ingredient_texts:
-        ingredient = parse_ingredient(text, client)
-        if ingredient:
-            ingredients.append(ingredient)
+    ingredients = [ingredient for ingredient in parsed if ingredient]
     
     return Recipe(
         name=name,
@@ -2,7 +2,8 @@
 Visualization utilities for nutrient analysis.
 """
 
-from typing import Dict, List, Any, Optional
+import json
+from typing import Dict, List, Any, Iterator, Optional, TextIO, overload
 
 from .analysis import NutrientAnalysis
 
@@ -89,27 +90,47 @@ def generate_dri_chart_data(analysis: NutrientAnalysis) -> Dict[str, Any]:
         }
     }
 
-def generate_html_report(analysis: NutrientAnalysis) -> str:
+@overload
+def generate_html_report(analysis: NutrientAnalysis, fp: None = ...) -> str: ...
+
+@overload
+def generate_html_report(analysis: NutrientAnalysis, fp: TextIO) -> None: ...
+
+def generate_html_report(
+    analysis: NutrientAnalysis,
+    fp: Optional[TextIO] = None
+) -> Optional[str]:
     """
     Generate an HTML report for a nutrient analysis.
     
     Args:
         analysis: The nutrient analysis.
+        fp: A text file to write the report to, piece by piece, instead of
+            building it in memory.
         
     Returns:
-        An HTML string.
+        An HTML string, or None if the report was written to ``fp``.
     """
+    chunks = _iter_html_report(analysis)
+    
+    if fp is not None:
+        fp.writelines(chunks)
+        return None
+    
+    return "".join(chunks)
+
+def _iter_html_report(analysis: NutrientAnalysis) -> Iterator[str]:
+    """Yield the HTML report for a nutrient analysis in pieces."""
     # Generate chart data
     macro_chart = generate_macronutrient_chart_data(analysis)
     dri_chart = generate_dri_chart_data(analysis)
     
     # Convert chart data to JSON strings
-    import json
     macro_chart_json = json.dumps(macro_chart)
     dri_chart_json = json.dumps(dri_chart)
     
     # Create HTML
-    html = f"""
+    yield f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -183,7 +204,7 @@ def generate_html_report(analysis: NutrientAnalysis) -> str:
         reverse=True
     ):
         dri_percent = f"{value.dri_percent:.1f}%" if value.dri_percent is not None else "N/A"
-        html += f"""
+        yield f"""
                 <tr>
                     <td>{value.nutrient.name}</td>
                     <td>{value.amount:.1f} {value.unit}</td>
@@ -192,7 +213,7 @@ def generate_html_report(analysis: NutrientAnalysis) -> str:
         """
     
     # Close the table and add chart initialization
-    html += f"""
+    yield f"""
             </table>
         </div>
         
@@ -207,6 +228,4 @@ def generate_html_report(analysis: NutrientAnalysis) -> str:
         </script>
     </body>
     </html>
-    """
-    
-    return html
\ No newline at end of file
+    """
\ No newline at end of file
@@ -3,6 +3,7 @@ Command-line interface for the USDA FDC client.
 """
 
 import argparse
+import dataclasses
 import json
 import os
 import sys
@@ -14,12 +15,22 @@ from . import __version__
 from .client import FdcClient
 from .exceptions import FdcApiError
 
+def _attributes(obj: Any) -> Dict[str, Any]:
+    """An object's attributes by name.
+
+    The models use slots where the Python version allows, so they may have no
+    __dict__; read their dataclass fields instead.
+    """
+    if dataclasses.is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    return obj.__dict__
+
 def format_output(data: Any, output_format: str) -> str:
     """Format output data based on specified format."""
     if output_format == "json":
-        return json.dumps(data, indent=2, default=lambda o: o.__dict__)
+        return json.dumps(data, indent=2, default=_attributes)
     elif output_format == "pretty":
-        if hasattr(data, "__dict__"):
+        if dataclasses.is_dataclass(data) or hasattr(data, "__dict__"):
             return pretty_print_object(data)
         elif isinstance(data, list):
             return "\n\n".join(pretty_print_object(item) for item in data)
@@ -55,7 +66,7 @@ def pretty_print_object(obj: Any) -> str:
         
         return "\n".join(result)
     
-    return str(obj.__dict__)
+    return str(_attributes(obj))
 
 def search_command(args: argparse.Namespace) -> None:
     """Handle search command."""
@@ -123,8 +134,9 @@ def list_command(args: argparse.Namespace) -> None:
 
 def main() -> None:
     """Main entry point for the CLI."""
-    # Load environment variables from .env file
-    load_dotenv()
+    # Load environment variables from .env file, unless the key is already set
+    if not os.environ.get("FDC_API_KEY"):
+        load_dotenv()
     
     # Create the top-level parser
     parser = argparse.ArgumentParser(
@@ -5,6 +5,8 @@ Core client for interacting with the USDA Food Data Central API.
 import os
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Union, Any
 from urllib.parse import urljoin
 from dotenv import load_dotenv
@@ -31,6 +33,24 @@ logger = logging.getLogger(__name__)
 # thread is lost for the life of the process.
 DEFAULT_TIMEOUT = 30.0
 
+# Connections kept open per host. requests' default of 10 is shared by every
+# thread using the client, so callers fanning get_food out over a thread pool
+# would otherwise queue behind it or pay a fresh TCP+TLS handshake per request.
+DEFAULT_POOL_SIZE = 16
+
+# Times to retry a request whose connection could not be established, with a
+# short backoff. Only connecting is retried: the request never reached the
+# server, so trying again is safe for every method. Read errors are not, as a
+# retried read timeout would stretch DEFAULT_TIMEOUT into several of them.
+DEFAULT_CONNECT_RETRIES = 3
+
+# Seconds to wait for a connection to be established, at most. urllib3 counts
+# a connect timeout as a connection error, so it is retried along with the
+# rest; with the full read timeout, an unreachable host would hold the caller
+# for four of them. Capped here, the worst case for an unreachable host is
+# about (DEFAULT_CONNECT_RETRIES + 1) * 5 s plus ~2 s of backoff, not minutes.
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
 class FdcClient:
     """
     Client for interacting with the USDA Food Data Central API.
@@ -39,7 +59,8 @@ class FdcClient:
         api_key (str): The API key for authenticating with the FDC API.
         base_url (str): The base URL for the FDC API.
         timeout (float): Seconds to wait for a response before raising
-            FdcTimeoutError.
+            FdcTimeoutError. Connecting is capped at DEFAULT_CONNECT_TIMEOUT
+            per attempt.
         session (requests.Session): A session object for making HTTP requests.
     """
 
@@ -47,7 +68,8 @@ class FdcClient:
         self,
         api_key: Optional[str] = None,
         base_url: str = "https://api.nal.usda.gov/fdc/v1/",
-        timeout: float = DEFAULT_TIMEOUT
+        timeout: float = DEFAULT_TIMEOUT,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize the FDC client.
@@ -57,15 +79,25 @@ class FdcClient:
                 If not provided, will look for FDC_API_KEY environment variable.
             base_url: The base URL for the FDC API.
             timeout: Seconds to wait for a response before raising
-                FdcTimeoutError. Applies to both connect and read.
+                FdcTimeoutError. Each connection attempt is also bounded by
+                it, but by no more than DEFAULT_CONNECT_TIMEOUT, since failed
+                connections are retried: an unreachable host raises after
+                about (DEFAULT_CONNECT_RETRIES + 1) * DEFAULT_CONNECT_TIMEOUT
+                seconds plus a short backoff.
+            session: A session to send requests through, such as a
+                ``requests_cache.CachedSession`` to keep responses between
+                runs. By default the client creates its own, with a
+                connection pool sized for concurrent callers that retries
+                failed connections.
 
         Raises:
             ValueError: If no API key is provided or found in environment variables.
         """
-        # Load environment variables from .env file
-        load_dotenv()
-
         self.api_key = api_key or os.environ.get("FDC_API_KEY")
+        if not self.api_key:
+            # Only read a .env file when the key is not already at hand
+            load_dotenv()
+            self.api_key = os.environ.get("FDC_API_KEY")
         if not self.api_key:
             raise ValueError(
                 "No API key provided. Pass api_key parameter or set FDC_API_KEY environment variable."
@@ -73,7 +105,18 @@ class FdcClient:
 
         self.base_url = base_url
         self.timeout = timeout
-        self.session = requests.Session()
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=DEFAULT_POOL_SIZE,
+                pool_maxsize=DEFAULT_POOL_SIZE,
+                max_retries=Retry(
+                    total=DEFAULT_CONNECT_RETRIES, read=False, backoff_factor=0.3
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
 
         # Send the key as a header, not a query parameter. requests puts the
         # full URL in its exception messages, so a key in the query string ends
@@ -121,7 +164,7 @@ class FdcClient:
                 url=url,
                 params=params,
                 json=data,
-                timeout=self.timeout
+                timeout=(min(self.timeout, DEFAULT_CONNECT_TIMEOUT), self.timeout)
             )
 
             response.raise_for_status()
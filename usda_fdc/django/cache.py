@@ -170,7 +170,11 @@ class FdcCache:
         
         # Try to get from Django models first
         if self.use_cache and not force_refresh:
-            food_models = FoodModel.objects.filter(fdc_id__in=fdc_ids)
+            # Fetch every food's nutrients and portions in one query each,
+            # rather than two more queries per food in to_food_object()
+            food_models = FoodModel.objects.filter(fdc_id__in=fdc_ids).prefetch_related(
+                "nutrients", "food_portions"
+            )
             found_ids = {model.fdc_id for model in food_models}
             
             for model in food_models:
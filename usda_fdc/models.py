@@ -2,12 +2,18 @@
 Data models for the USDA FDC API.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 
+# A search or list call can return hundreds of foods, each with dozens of
+# nutrients. Slots drop the per-instance __dict__ from every one of them.
+# dataclass(slots=True) needs Python 3.10; older versions get plain classes.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Nutrient:
     """
     Represents a nutrient in a food item.
@@ -67,7 +73,7 @@ class Nutrient:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FoodPortion:
     """
     Represents a food portion.
@@ -105,7 +111,7 @@ class FoodPortion:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Food:
     """
     Represents a food item from the FDC database.
@@ -184,7 +190,7 @@ class Food:
         return food
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SearchResultFood:
     """
     Represents a food item in search results.
@@ -221,7 +227,7 @@ class SearchResultFood:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SearchResult:
     """
     Represents search results from the FDC API.
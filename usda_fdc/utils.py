@@ -2,6 +2,7 @@
 Utility functions for the USDA FDC client.
 """
 
+import functools
 import re
 from typing import Dict, Any, Optional, Tuple, Union
 from pint import UnitRegistry, UndefinedUnitError, DimensionalityError
@@ -20,6 +21,19 @@ ureg.define('slice = 1 = slice')
 ureg.define('piece = 1 = piece')
 
 
+@functools.lru_cache(maxsize=256)
+def _conversion_factor(from_unit: str, to_unit: str) -> float:
+    """
+    How many ``to_unit`` make one ``from_unit``.
+
+    Asking pint parses both unit strings and builds a quantity on every call.
+    Only a few unit pairs ever occur, so each is asked once and every later
+    conversion is a multiplication. Failures are not cached; pint's error
+    propagates for the caller to word.
+    """
+    return (1.0 * ureg(from_unit)).to(to_unit).magnitude
+
+
 def parse_unit_and_value(measurement_str: str) -> Tuple[float, str]:
     """
     Parse a measurement string into a value and unit.
@@ -64,9 +78,7 @@ def convert_to_grams(amount: float, unit: str) -> float:
         ValueError: If the unit cannot be converted to grams.
     """
     try:
-        # Try to convert to grams
-        quantity = amount * ureg(unit)
-        return quantity.to('gram').magnitude
+        return amount * _conversion_factor(unit, 'gram')
     except (UndefinedUnitError, DimensionalityError) as e:
         raise ValueError(f"Cannot convert {unit} to grams: {str(e)}")
 
@@ -86,9 +98,7 @@ def convert_to_milliliters(amount: float, unit: str) -> float:
         ValueError: If the unit cannot be converted to milliliters.
     """
     try:
-        # Try to convert to milliliters
-        quantity = amount * ureg(unit)
-        return quantity.to('milliliter').magnitude
+        return amount * _conversion_factor(unit, 'milliliter')
     except (UndefinedUnitError, DimensionalityError) as e:
         raise ValueError(f"Cannot convert {unit} to milliliters: {str(e)}")
 
@@ -113,8 +123,7 @@ def convert_measurement(
         ValueError: If the conversion is not possible.
     """
     try:
-        quantity = amount * ureg(from_unit)
-        return quantity.to(to_unit).magnitude
+        return amount * _conversion_factor(from_unit, to_unit)
     except (UndefinedUnitError, DimensionalityError) as e:
         raise ValueError(f"Cannot convert {from_unit} to {to_unit}: {str(e)}")
 